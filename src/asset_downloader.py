@@ -10,6 +10,7 @@ from pathlib import Path
 
 import requests
 
+from .cache_warmer import warm_sound_cache, warm_sprite_cache
 from .configs_loader import BASE_DIR, GREMLIN_DIRS
 
 
@@ -67,3 +68,15 @@ if __name__ == "__main__":
             print(f"\t->'{gremlin}' is installed successfully!")
         except Exception as e:
             print(f"Failed to install '{gremlin}': {e}")
+            continue
+
+        # decodes the spritesheets and sounds now so that the first launch is fast,
+        # but the gremlin is installed either way
+        try:
+            warm_sprite_cache(gremlin)
+        except Exception as e:
+            print(f"\t->Could not cache spritesheets of '{gremlin}': {e}")
+        try:
+            warm_sound_cache(gremlin)
+        except Exception as e:
+            print(f"\t->Could not cache sounds of '{gremlin}': {e}")
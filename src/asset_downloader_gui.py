@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
 )
 
 from .asset_downloader import download_asset
+from .cache_warmer import warm_sound_cache, warm_sprite_cache
 from .configs_loader import BASE_DIR, GREMLIN_DIRS
 
 
@@ -56,10 +57,22 @@ class DownloadWorker(QThread):
     def run(self):
         try:
             download_asset(self.url)
+            self.warm_cache()
             self.finished.emit(True, self.asset_name)
         except Exception as e:
             self.finished.emit(False, str(e))
 
+    def warm_cache(self):
+        # decoding sprites and sounds now makes the first launch fast, but it's optional
+        try:
+            warm_sprite_cache(self.asset_name)
+        except Exception as e:
+            print(f"Could not cache spritesheets of '{self.asset_name}': {e}")
+        try:
+            warm_sound_cache(self.asset_name)
+        except Exception as e:
+            print(f"Could not cache sounds of '{self.asset_name}': {e}")
+
 
 class AssetDownloaderGui(QDialog):
     def __init__(self, parent=None):
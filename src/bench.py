@@ -0,0 +1,392 @@
+"""
+Headless end-to-end benchmark of a gremlin.
+
+    python -m src.bench [--char NAME] [--cold] [--out FILE]
+
+Starts GremlinWindow offscreen, plays a scripted scenario (intro, hover, walking in
+all 8 directions, a 1 kHz drag, poke, pat, emote, outro) through synthetic input
+events, and prints a JSON report: CPU time per frame, frame-pacing jitter, peak RSS,
+time to first frame, drag coalescing and sheet-decode totals. Without --char, a
+character is generated so that results compare across machines and releases.
+
+Sprite and sound caches go to a temporary directory, unless XDG_CACHE_HOME is set
+(e.g. to keep them warm between runs).
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+# must be set before Qt is loaded
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# must be set before the caches are imported; removed on exit
+_CACHE_HOME: tempfile.TemporaryDirectory | None = None
+if not os.environ.get("XDG_CACHE_HOME"):
+    _CACHE_HOME = tempfile.TemporaryDirectory(prefix="gremlin-bench-")
+    os.environ["XDG_CACHE_HOME"] = _CACHE_HOME.name
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt, QTimer  # noqa: E402
+from PySide6.QtGui import (  # noqa: E402
+    QColor,
+    QEnterEvent,
+    QImage,
+    QKeyEvent,
+    QMouseEvent,
+    QPainter,
+)
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+from . import configs_loader  # noqa: E402
+from .engines.sprite_engine import CACHE, POOL  # noqa: E402
+from .profiler import PROFILER  # noqa: E402
+from .settings import Preferences  # noqa: E402
+from .states import Direction, State, to_pascal_case  # noqa: E402
+from .window.hotspot_geometry import compute_top_hotspot_geometry  # noqa: E402
+
+GENERATED_CHAR = "benchgremlin"
+
+# a scenario step yields how many ms to wait before it resumes
+Scenario = Iterator[int]
+
+"""
+@! ---- Generated character ----------------------------------------------------------------------
+"""
+
+
+def generate_char(root: Path, size: int = 256, frames: int = 16) -> None:
+    """Writes a character with one distinct sheet per animation into `root`."""
+    cols = 4
+    sprites = root / GENERATED_CHAR / "sprites"
+    sounds = root / GENERATED_CHAR / "sounds"
+    sprites.mkdir(parents=True)
+    sounds.mkdir(parents=True)
+
+    sprite_map = {
+        "FrameRate": 60,
+        "SpriteColumn": cols,
+        "FrameHeight": size,
+        "FrameWidth": size,
+        "TopHotspotHeight": size // 4,
+        "TopHotspotWidth": size // 2,
+        "SideHotspotHeight": size // 2,
+        "SideHotspotWidth": size // 8,
+        "HasReloadAnimation": True,
+    }
+    frame_count = {}
+    keys = [to_pascal_case(s) for s in State if s != State.WALK]
+    keys += [to_pascal_case(d) for d in Direction if d != Direction.NONE]
+    for i, key in enumerate(keys):
+        sheet = QImage(
+            size * cols,
+            size * ((frames + cols - 1) // cols),
+            QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        sheet.fill(0)
+        painter = QPainter(sheet)
+        for f in range(frames):
+            # a breathing body, with every other frame held like hand-drawn sprites do
+            x, y = (f % cols) * size, (f // cols) * size
+            breath = (f // 2) % 4 * size // 64
+            painter.fillRect(
+                x + size // 4,
+                y + size // 8 + breath,
+                size // 2,
+                size * 3 // 4 - breath,
+                QColor((40 * i) % 256, 120, 200),
+            )
+        painter.end()
+        sheet.save(str(sprites / f"{key.lower()}.png"))
+        sprite_map[key] = f"{key.lower()}.png"
+        frame_count[key] = frames
+
+    emote_config = {
+        "AnnoyEmote": True,
+        "MinEmoteTriggerMinutes": 5,
+        "MaxEmoteTriggerMinutes": 15,
+        "EmoteDuration": 1000,
+    }
+    for name, data in [
+        ("sprite-map.json", sprite_map),
+        ("frame-count.json", frame_count),
+        ("emote-config.json", emote_config),
+    ]:
+        (sprites / name).write_text(json.dumps(data))
+    (sounds / "sfx-map.json").write_text("{}")
+
+
+"""
+@! ---- Scenario ---------------------------------------------------------------------------------
+"""
+
+
+def _send(target: QWidget, event: QEvent) -> None:
+    QApplication.sendEvent(target, event)
+
+
+def _key(window: QWidget, kind: QEvent.Type, key: int) -> None:
+    _send(window, QKeyEvent(kind, key, Qt.KeyboardModifier.NoModifier))
+
+
+def _right_click(window: QWidget, pos: QPoint) -> None:
+    # deliver to whatever is under `pos`, so hotspots get their clicks
+    target = window.childAt(pos) or window
+    local = QPointF(target.mapFrom(window, pos))
+    for kind in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+        _send(
+            target,
+            QMouseEvent(
+                kind,
+                local,
+                QPointF(window.mapToGlobal(pos)),
+                Qt.MouseButton.RightButton,
+                Qt.MouseButton.RightButton,
+                Qt.KeyboardModifier.NoModifier,
+            ),
+        )
+
+
+def _mouse(window: QWidget, kind: QEvent.Type, pos: QPoint) -> None:
+    buttons = (
+        Qt.MouseButton.NoButton
+        if kind == QEvent.Type.MouseButtonRelease
+        else Qt.MouseButton.LeftButton
+    )
+    _send(
+        window,
+        QMouseEvent(
+            kind,
+            QPointF(pos),
+            QPointF(window.mapToGlobal(pos)),
+            Qt.MouseButton.LeftButton,
+            buttons,
+            Qt.KeyboardModifier.NoModifier,
+        ),
+    )
+
+
+def _drag(window: QWidget, start: QPoint, rate_hz: int, ms: int) -> Scenario:
+    # a high polling rate mouse, delivering its reports in bursts every 4ms
+    _mouse(window, QEvent.Type.MouseButtonPress, start)
+    per_burst = rate_hz * 4 // 1000
+    for i in range(ms * rate_hz // 1000):
+        _mouse(window, QEvent.Type.MouseMove, start + QPoint(i // 4, i // 8))
+        if i % per_burst == per_burst - 1:
+            yield 4
+    _mouse(window, QEvent.Type.MouseButtonRelease, start)
+
+
+def _wait_until(condition: Callable[[], bool], timeout_ms: int = 10000) -> Scenario:
+    waited = 0
+    while not condition() and waited < timeout_ms:
+        yield 10
+        waited += 10
+
+
+WALKS = [
+    [Qt.Key.Key_W],
+    [Qt.Key.Key_W, Qt.Key.Key_D],
+    [Qt.Key.Key_D],
+    [Qt.Key.Key_S, Qt.Key.Key_D],
+    [Qt.Key.Key_S],
+    [Qt.Key.Key_S, Qt.Key.Key_A],
+    [Qt.Key.Key_A],
+    [Qt.Key.Key_W, Qt.Key.Key_A],
+]
+
+
+def scenario(window, mark: Callable[[str], None]) -> Scenario:
+    """Plays the gremlin through every kind of interaction, marking each phase."""
+    state = lambda: window.state_manager.current_state  # noqa: E731
+    settled = lambda: state() in (State.IDLE, State.HOVER)  # noqa: E731
+    center = QPoint(window.width() // 2, window.height() // 2)
+
+    mark("intro")
+    yield from _wait_until(lambda: state() != State.INTRO)
+
+    mark("hover")
+    _send(window, QEnterEvent(QPointF(center), QPointF(center), QPointF(center)))
+    yield 1000
+
+    mark("walk")
+    for keys in WALKS:
+        for key in keys:
+            _key(window, QEvent.Type.KeyPress, key)
+        yield 500
+        for key in keys:
+            _key(window, QEvent.Type.KeyRelease, key)
+    yield from _wait_until(settled)
+
+    mark("drag")
+    yield from _drag(window, center, 1000, 1000)
+    yield from _wait_until(settled)
+
+    mark("poke")
+    _right_click(window, center)
+    yield from _wait_until(settled)
+
+    mark("pat")
+    x, y, w, h = compute_top_hotspot_geometry()
+    _right_click(window, QPoint(x + w // 2, y + h // 2))
+    yield from _wait_until(settled)
+
+    mark("emote")
+    window.state_manager.transition_to(State.EMOTE)
+    window.timer_manager.reset_emote_dur_timer()
+    yield from _wait_until(settled)
+
+    mark("outro")
+    _send(window, QEvent(QEvent.Type.Leave))
+    window.close_app()
+
+
+"""
+@! ---- Runner -----------------------------------------------------------------------------------
+"""
+
+
+class Bench:
+    def __init__(self, app: QApplication, char: str, generated: bool) -> None:
+        self.app = app
+        self.report: dict = {"character": char, "generated": generated}
+        self._phases: list[dict] = []
+        self._first_frame_ms: float | None = None
+
+    def run(self) -> dict:
+        PROFILER.enable()
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        from .window.gremlin_window import GremlinWindow
+
+        window = GremlinWindow()
+        self._watch_first_frame(window, start)
+
+        # end on the last frame of the outro instead of exiting the process
+        window.state_manager.on_exit = lambda: self._finish(window)
+        window.show()
+
+        self._mark = lambda name: self._phases.append(self._snapshot(name))
+        self._steps = scenario(window, self._mark)
+        QTimer.singleShot(0, self._step)
+        self.app.exec()
+
+        wall = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+        self._finish_phases()
+        self.report.update(self._summary(wall, cpu))
+        return self.report
+
+    def _watch_first_frame(self, window, start: float) -> None:
+        # when it's on screen, like the startup profile's first_frame
+        def on_first_painted() -> None:
+            self._first_frame_ms = (time.perf_counter() - start) * 1000
+
+        window.sprite_widget.first_painted.connect(on_first_painted)
+
+    def _step(self) -> None:
+        try:
+            QTimer.singleShot(next(self._steps), self._step)
+        except StopIteration:
+            pass
+
+    def _finish(self, window) -> None:
+        self._mark("end")
+        window.timer_manager.stop_all()
+        window.frame_engine.loader.stop()
+        # quit() would close the window, which starts the outro all over again
+        self.app.exit(0)
+
+    def _snapshot(self, name: str) -> dict:
+        tick = PROFILER.histograms.get("tick")
+        return {
+            "name": name,
+            "t": time.perf_counter(),
+            "cpu": time.process_time(),
+            "ticks": tick.count if tick else 0,
+        }
+
+    def _finish_phases(self) -> None:
+        phases = []
+        for a, b in zip(self._phases, self._phases[1:]):
+            ticks = b["ticks"] - a["ticks"]
+            cpu_ms = (b["cpu"] - a["cpu"]) * 1000
+            phases.append(
+                {
+                    "name": a["name"],
+                    "wall_ms": round((b["t"] - a["t"]) * 1000, 1),
+                    "ticks": ticks,
+                    "cpu_ms_per_tick": round(cpu_ms / ticks, 3) if ticks else None,
+                }
+            )
+        self.report["phases"] = phases
+
+    def _summary(self, wall: float, cpu: float) -> dict:
+        profile = PROFILER.report()
+        sections = profile["sections"]
+        ticks = sections.get("tick", {}).get("count", 0)
+        decode = PROFILER.histograms.get("decode")
+        return {
+            "wall_s": round(wall, 3),
+            "cpu_s": round(cpu, 3),
+            "ticks": ticks,
+            "cpu_ms_per_tick": round(cpu * 1000 / ticks, 3) if ticks else None,
+            "time_to_first_frame_ms": (
+                round(self._first_frame_ms, 1) if self._first_frame_ms else None
+            ),
+            "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "jitter_us": sections.get("late"),
+            "tick_us": sections.get("tick"),
+            "drag": {
+                "events": profile["counters"].get("drag_events", 0),
+                "window_moves": profile["counters"].get("drag_moves", 0),
+                "latency_us": sections.get("drag_latency"),
+            },
+            "missed_deadlines": profile["counters"].get("missed_deadlines", 0),
+            "skipped_ticks": profile["counters"].get("skipped_ticks", 0),
+            "decode": {
+                "sheets": decode.count if decode else 0,
+                "total_ms": round(decode.total_ns / 1e6, 1) if decode else 0,
+            },
+            "sections_us": sections,
+            "frame_cache": CACHE.stats(),
+            "frame_pool": POOL.stats(),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--char", help="installed character (default: generated)")
+    parser.add_argument(
+        "--cold", action="store_true", help="bypass the on-disk sprite cache"
+    )
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmp:
+        char = args.char
+        if char is None:
+            char = GENERATED_CHAR
+            generate_char(Path(tmp))
+            configs_loader.GREMLIN_DIRS.insert(0, Path(tmp))
+        configs_loader.load_resources_and_preferences(char)
+        if args.cold:
+            Preferences.SpriteDiskCache = False
+        report = Bench(app, char, args.char is None).run()
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
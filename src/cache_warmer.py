@@ -0,0 +1,53 @@
+"""
+Fills the on-disk sprite and sound caches of gremlins ahead of time,
+so that even their first launch skips PNG and audio decoding.
+"""
+
+import sys
+
+from PySide6.QtCore import QCoreApplication
+
+from . import configs_loader
+from .engines import sound_cache
+from .engines.sprite_engine import prefill_disk_cache
+from .resources import ResourceRegistry
+
+
+def warm_sprite_cache(char: str) -> int:
+    """
+    Decodes every spritesheet of `char` into the disk cache.
+    Returns the number of sheets that were not cached yet.
+    """
+    ResourceRegistry.animations.clear()
+    configs_loader.load_resources_and_preferences(char)
+    return prefill_disk_cache()
+
+
+def warm_sound_cache(char: str) -> int:
+    """
+    Transcodes every sound of `char` into the sound cache.
+    Returns the number of sounds that were not cached yet.
+    """
+    ResourceRegistry.sounds.clear()
+    configs_loader.load_resources_and_preferences(char)
+
+    # QAudioDecoder needs an event loop
+    app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841
+    fmt = sound_cache.output_format(sound_cache.output_device())
+    sound_cache.remember_format(fmt)
+    added = 0
+    for path in {data.source_path for data in ResourceRegistry.sounds.values()}:
+        if sound_cache.lookup(path, fmt) is None and sound_cache.transcode(path, fmt):
+            added += 1
+    return added
+
+
+if __name__ == "__main__":
+    for char in sys.argv[1:]:
+        try:
+            added = warm_sprite_cache(char)
+            print(f"'{char}': cached {added} new spritesheet(s)")
+            added = warm_sound_cache(char)
+            print(f"'{char}': cached {added} new sound(s)")
+        except Exception as e:
+            print(f"Failed to cache '{char}': {e}")
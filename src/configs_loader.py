@@ -4,8 +4,10 @@ import os
 from enum import Enum
 from pathlib import Path
 
+from .engines import sound_cache
 from .resources import AnimationData, ResourceRegistry, SoundData, SpriteProperties
 from .settings import EmotePreferences, HotspotSettings, Preferences
+from .startup_profile import STARTUP
 from .states import Direction, State, to_pascal_case
 
 CODE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -43,6 +45,7 @@ def load_resources_and_preferences(char: str | None = None):
     frame_config = _load_char_json(char, ResourceType.SPRITESHEET, "frame-count.json")
     sprite_config = _load_char_json(char, ResourceType.SPRITESHEET, "sprite-map.json")
     sound_config = _load_char_json(char, ResourceType.SOUND, "sfx-map.json")
+    STARTUP.mark("config_load")
 
     # load character configs & resources
     _load_emote_config(emote_config)
@@ -50,6 +53,7 @@ def load_resources_and_preferences(char: str | None = None):
     _load_sprite_properties(char, sprite_config)
     _load_sprite_resource(char, sprite_config, frame_config)
     _load_sound_resource(char, sound_config)
+    STARTUP.mark("resources")
 
 
 """
@@ -141,16 +145,31 @@ def _load_master_config(master_config: dict):
     optional = [
         "Systray",
         "MoveSpeed",
+        "MoveAcceleration",
         "Volume",
         "AudioDevice",
+        "SoundVoices",
+        "SoundVoiceStealing",
+        "SoundNormalize",
         "Scale",
         "AnimationSpeed",
         "EmoteKey",
         "EmoteKeyEnabled",
         "IdleMinutes",
         "SleepMinutes",
+        "SpriteCacheMB",
+        "SpriteDiskCache",
+        "FrameRateCaps",
+        "PositionBackend",
+        "TickProfile",
     ]
     _load_to_class(master_config, Preferences, required, optional)
+    _check_frame_rate_caps(Preferences.FrameRateCaps)
+    if Preferences.SoundVoiceStealing not in ("oldest", "none"):
+        raise ValueError("SoundVoiceStealing must be 'oldest' or 'none'")
+    backends = ("auto", "qt", "niri", "sway", "hyprland")
+    if Preferences.PositionBackend not in backends:
+        raise ValueError(f"PositionBackend must be one of {', '.join(backends)}")
 
 
 def _load_emote_config(emote_config: dict):
@@ -186,7 +205,20 @@ def _load_sprite_properties(char: str, sprite_config: dict):
         "FrameWidth",
         "HasReloadAnimation",
     ]
-    _load_to_class(sprite_config, SpriteProperties, required, [])
+    optional = [
+        "FrameRateCaps",
+    ]
+    _load_to_class(sprite_config, SpriteProperties, required, optional)
+    _check_frame_rate_caps(SpriteProperties.FrameRateCaps)
+
+
+def _check_frame_rate_caps(caps: dict):
+    valid_keys = {to_pascal_case(state) for state in State}
+    for key, cap in caps.items():
+        if key not in valid_keys:
+            raise ValueError(f"Unknown state '{key}' in FrameRateCaps")
+        if type(cap) not in (int, float) or cap <= 0:
+            raise ValueError(f"Frame rate cap of '{key}' must be a positive number")
 
 
 def _load_sprite_resource(char: str, sprite_config: dict, frame_config: dict):
@@ -202,6 +234,17 @@ def _load_sprite_resource(char: str, sprite_config: dict, frame_config: dict):
             State.RELOAD,
         ]
 
+    # optional per-frame durations (in ticks), e.g. "Durations": {"Sleep": [4, 4, ...]}
+    duration_config = frame_config.get("Durations", {})
+
+    def durations(key: str, frame_count: int) -> list[int]:
+        ans = duration_config.get(key, [])
+        if not isinstance(ans, list) or not all(type(d) is int and d > 0 for d in ans):
+            raise ValueError(f"Durations of '{key}' must be a list of positive ints")
+        if ans and len(ans) != frame_count:
+            raise ValueError(f"Durations of '{key}' must have {frame_count} entries")
+        return ans
+
     # function for registering animation data
     def register(state: State):
         state_key = to_pascal_case(state)
@@ -214,7 +257,10 @@ def _load_sprite_resource(char: str, sprite_config: dict, frame_config: dict):
         sprite_path = _get_char_file(char, ResourceType.SPRITESHEET, sprite_name)
         sprite_frames = frame_config[state_key]
         ResourceRegistry.animations[(state, Direction.NONE)] = AnimationData(
-            sprite_path=sprite_path, frame_count=sprite_frames, current_frame=0
+            sprite_path=sprite_path,
+            frame_count=sprite_frames,
+            current_frame=0,
+            frame_durations=durations(state_key, sprite_frames),
         )
 
     # function for registering animation data if available
@@ -238,7 +284,10 @@ def _load_sprite_resource(char: str, sprite_config: dict, frame_config: dict):
             sprite_path = _get_char_file(char, ResourceType.SPRITESHEET, sprite_name)
             sprite_frames = frame_config[key]
             ResourceRegistry.animations[(State.WALK, direction)] = AnimationData(
-                sprite_path=sprite_path, frame_count=sprite_frames, current_frame=0
+                sprite_path=sprite_path,
+                frame_count=sprite_frames,
+                current_frame=0,
+                frame_durations=durations(key, sprite_frames),
             )
 
     # find spritesheet for every state
@@ -258,8 +307,11 @@ def _load_sound_resource(char: str, sound_config: dict):
         try:
             sound_name = sound_config[state_key]
             sound_path = _get_char_file(char, ResourceType.SOUND, sound_name)
+            # play the transcoded WAV once there is one (see SoundEngine)
             ResourceRegistry.sounds[state] = SoundData(
-                sound_path=sound_path, last_played=datetime.datetime.now()
+                sound_path=sound_cache.lookup(sound_path) or sound_path,
+                last_played=datetime.datetime.now(),
+                source_path=sound_path,
             )
         except (KeyError, FileNotFoundError):
             pass
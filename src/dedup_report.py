@@ -0,0 +1,77 @@
+"""
+Reports how much memory frame deduplication saves on the installed gremlins,
+as if all of them were loaded in the same process.
+
+Usage: python -m src.dedup_report [character...]   (default: every installed one)
+"""
+
+import sys
+
+from . import configs_loader
+from .configs_loader import GREMLIN_DIRS
+from .engines.sprite_engine import decode_frames
+from .resources import ResourceRegistry
+
+
+def installed_chars() -> list[str]:
+    chars = set()
+    for directory in GREMLIN_DIRS:
+        if directory.is_dir():
+            chars.update(p.name for p in directory.iterdir() if p.is_dir())
+    return sorted(chars)
+
+
+def measure(chars: list[str]) -> dict:
+    """
+    Decodes every spritesheet of `chars` and compares the bytes taken by storing each
+    sheet's frames separately against storing every distinct frame once.
+    Animations sharing a sheet share its frames anyway (see find_shared_frames), so
+    each sheet counts once in the baseline.
+    """
+    seen: dict[bytes, int] = {}
+    report = {"chars": {}, "logical_bytes": 0, "unique_bytes": 0}
+
+    for char in chars:
+        ResourceRegistry.animations.clear()
+        configs_loader.load_resources_and_preferences(char)
+
+        logical = 0
+        unique = 0
+        sheets = set()
+        for data in ResourceRegistry.animations.values():
+            key = (data.sprite_path, data.frame_count)
+            if key in sheets:
+                continue
+            sheets.add(key)
+            for image, _, _, digest in decode_frames(*key):
+                logical += image.sizeInBytes()
+                if digest not in seen:
+                    seen[digest] = image.sizeInBytes()
+                    unique += image.sizeInBytes()
+
+        report["chars"][char] = {"logical_bytes": logical, "unique_bytes": unique}
+        report["logical_bytes"] += logical
+        report["unique_bytes"] += unique
+
+    report["saved_bytes"] = report["logical_bytes"] - report["unique_bytes"]
+    return report
+
+
+def _mb(nbytes: int) -> str:
+    return f"{nbytes / (1024 * 1024):9.1f} MB"
+
+
+if __name__ == "__main__":
+    chars = sys.argv[1:] or installed_chars()
+    report = measure(chars)
+
+    print(f"{'character':<24}{'without dedup':>16}{'with dedup':>16}")
+    for char, row in report["chars"].items():
+        print(
+            f"{char:<24}{_mb(row['logical_bytes']):>16}{_mb(row['unique_bytes']):>16}"
+        )
+    print(
+        f"{'total':<24}{_mb(report['logical_bytes']):>16}"
+        f"{_mb(report['unique_bytes']):>16}"
+    )
+    print(f"dedup saves {_mb(report['saved_bytes']).strip()}")
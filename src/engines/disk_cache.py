@@ -0,0 +1,231 @@
+"""
+Persistent cache of decoded spritesheets, so warm starts skip PNG inflation.
+
+Layout under ~/.cache/linux-desktop-gremlin/sprites/:
+- <content hash>-<variant hash>.argb:  raw premultiplied ARGB32 pixels after a small
+                                       header, laid out to be mmap'ed as-is.
+- index/<hash of path, size, mtime>:   name of the .argb file for that exact source file.
+
+A changed source file misses the index, gets re-hashed, and reuses the data file
+if its content is actually the same. Past MAX_BYTES, the least recently used data
+files are deleted when a new one is stored, along with the index files pointing to
+them, so sheets that were edited or decoded at an old scale don't pile up.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from PySide6.QtGui import QImage
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"))
+    / "linux-desktop-gremlin"
+    / "sprites"
+)
+
+IMAGE_FORMAT = QImage.Format.Format_ARGB32_Premultiplied
+
+# total size of the data files kept
+MAX_BYTES = 512 * 1024 * 1024
+
+# header: magic, width, height, bytes per line
+# pixels start at a fixed offset so they stay aligned inside the mapping
+_MAGIC = b"GRMLARGB"
+_HEADER = struct.Struct("<8sIII")
+_DATA_OFFSET = 64
+
+
+@contextmanager
+def open_image(path: str, variant: str) -> Iterator[QImage | None]:
+    """
+    Maps the cached decoded image of `path` into memory, or yields None on a miss.
+    `variant` names how the image was decoded (e.g. at which scale).
+
+    The image points straight into the mapping, so it's only valid inside the
+    `with` block: copy out whatever must outlive it.
+    """
+    data_path = _lookup(path, variant)
+    if data_path is None:
+        yield None
+        return
+
+    try:
+        with open(data_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        yield None
+        return
+
+    with mm:
+        header = _parse_header(mm)
+        if header is None:
+            yield None
+            return
+        w, h, bpl = header
+        view = memoryview(mm)[_DATA_OFFSET:]
+        try:
+            yield QImage(view, w, h, bpl, IMAGE_FORMAT)
+        finally:
+            view.release()
+
+
+def contains(path: str, variant: str) -> bool:
+    return _lookup(path, variant) is not None
+
+
+def store_image(path: str, variant: str, image: QImage) -> None:
+    """
+    Saves the decoded `image` of `path`. Caching is best-effort: any I/O error
+    (read-only home, full disk...) is silently ignored.
+    """
+    if image.isNull():
+        return
+    if image.format() != IMAGE_FORMAT:
+        image = image.convertToFormat(IMAGE_FORMAT)
+
+    try:
+        data_path = _data_file(hash_file(path), variant)
+        if not data_path.exists():
+            header = _HEADER.pack(
+                _MAGIC, image.width(), image.height(), image.bytesPerLine()
+            )
+            write_atomic(
+                data_path,
+                header.ljust(_DATA_OFFSET, b"\0"),
+                image.constBits(),
+            )
+        write_atomic(_index_file(path, variant), data_path.name.encode())
+    except OSError:
+        return
+    prune(CACHE_DIR, ".argb", MAX_BYTES)
+
+
+def prune(cache_dir: Path, suffix: str, max_bytes: int) -> None:
+    """
+    Deletes the least recently used `suffix` files of `cache_dir` until they take at
+    most `max_bytes`, then the index files pointing to files that are gone.
+    """
+    try:
+        data = sorted(
+            (e for e in os.scandir(cache_dir) if e.name.endswith(suffix)),
+            key=lambda e: e.stat().st_mtime_ns,
+        )
+        total = sum(e.stat().st_size for e in data)
+    except OSError:
+        return  # e.g. another gremlin is pruning it
+    removed = False
+    for entry in data:
+        if total <= max_bytes:
+            break
+        try:
+            size = entry.stat().st_size
+            os.unlink(entry.path)  # gremlins that have it mapped keep their mapping
+            total -= size
+            removed = True
+        except OSError:
+            pass  # another gremlin pruned it already
+    if not removed:
+        return
+
+    try:
+        index_entries = list(os.scandir(cache_dir / "index"))
+    except OSError:
+        return
+    for entry in index_entries:
+        try:
+            if not (cache_dir / Path(entry.path).read_text().strip()).is_file():
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+"""
+@! ---- Keys ------------------------------------------------------------------------------------
+"""
+
+
+def _lookup(path: str, variant: str) -> Path | None:
+    # fast path: the source file is exactly as it was when it was cached
+    try:
+        index = _index_file(path, variant)
+        data_path = CACHE_DIR / index.read_text().strip()
+        if data_path.is_file():
+            _touch(data_path)
+            return data_path
+    except OSError:
+        pass
+
+    # the source file changed or moved, but its content may still be cached
+    try:
+        data_path = _data_file(hash_file(path), variant)
+        if data_path.is_file():
+            _touch(data_path)
+            write_atomic(_index_file(path, variant), data_path.name.encode())
+            return data_path
+    except OSError:
+        pass
+    return None
+
+
+def _touch(data_path: Path) -> None:
+    # its mtime tells prune() when it was last used
+    try:
+        os.utime(data_path)
+    except OSError:
+        pass
+
+
+def _index_file(path: str, variant: str) -> Path:
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}|{variant}"
+    return CACHE_DIR / "index" / digest(key.encode())
+
+
+def _data_file(content_hash: str, variant: str) -> Path:
+    return CACHE_DIR / f"{content_hash}-{digest(variant.encode())}.argb"
+
+
+def hash_file(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+"""
+@! ---- File utilities --------------------------------------------------------------------------
+"""
+
+
+def _parse_header(mm: mmap.mmap) -> tuple[int, int, int] | None:
+    if len(mm) < _DATA_OFFSET:
+        return None
+    magic, w, h, bpl = _HEADER.unpack_from(mm)
+    if magic != _MAGIC or len(mm) < _DATA_OFFSET + h * bpl:
+        return None
+    return w, h, bpl
+
+
+def write_atomic(target: Path, *chunks) -> None:
+    # several gremlins (or decode threads) may write the same entry at once
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, target)
+    except OSError:
+        os.unlink(tmp)
+        raise
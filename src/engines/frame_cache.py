@@ -0,0 +1,175 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterator, Tuple
+
+from PySide6.QtGui import QPixmap
+
+from ..settings import Preferences
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    """
+    A frame with its transparent padding trimmed off:
+    `pixmap` holds the visible pixels, painted at (`x`, `y`) inside the window.
+    """
+
+    pixmap: QPixmap
+    x: int
+    y: int
+
+
+Frames = Tuple[Frame, ...]
+
+
+def frames_nbytes(frames: Frames) -> int:
+    """Approximate memory held by the pixmaps of some frames."""
+    return sum(
+        f.pixmap.width() * f.pixmap.height() * f.pixmap.depth() // 8 for f in frames
+    )
+
+
+class FrameCache:
+    """
+    Least-recently-used cache of animation frames, bounded by their size in bytes.
+
+    The budget is read from `Preferences.SpriteCacheMB` (0 means unlimited).
+    The pinned entry, i.e. the animation that is currently playing, is never evicted.
+
+    Animations may share pixmaps (see FramePool), so memory is accounted per distinct
+    pixmap: `nbytes` is what is actually resident, `logical_bytes` is what it would
+    take without sharing.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Hashable, Frames] = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._refs: Dict[int, int] = {}  # pixmap cache key -> number of uses
+        self._pinned: Hashable | None = None
+        self.nbytes = 0
+        self.logical_bytes = 0
+
+        # counters for sizing the budget
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Frames | None:
+        frames = self._entries.get(key)
+        if frames is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return frames
+
+    def put(self, key: Hashable, frames: Frames, speculative: bool = False) -> bool:
+        """
+        Inserts `frames`, evicting least recently used entries if over budget.
+        Speculative (prefetched) frames are only inserted if they fit in the space
+        that is left, so they never push out frames that are already cached.
+        Returns True if the frames were inserted.
+        """
+        if speculative and not self.fits(self._new_bytes(frames)):
+            return False
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = frames
+        self._sizes[key] = frames_nbytes(frames)
+        self.logical_bytes += self._sizes[key]
+        self._retain(frames)
+        self._evict()
+        return True
+
+    def fits(self, nbytes: int) -> bool:
+        """Returns True if `nbytes` more can be cached without evicting anything."""
+        budget = self._budget()
+        return budget == 0 or self.nbytes + nbytes <= budget
+
+    def pin(self, key: Hashable) -> None:
+        """Protects `key` from eviction until another key is pinned."""
+        self._pinned = key
+
+    def items(self) -> Iterator[Tuple[Hashable, Frames]]:
+        """Iterates entries without touching their recency or the counters."""
+        return iter(list(self._entries.items()))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self._refs.clear()
+        self.nbytes = 0
+        self.logical_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "budget_bytes": self._budget(),
+            "logical_bytes": self.logical_bytes,
+            "dedup_saved_bytes": self.logical_bytes - self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    """
+    @! ---- Eviction -------------------------------------------------------------------------------
+    """
+
+    def _budget(self) -> int:
+        return max(0, Preferences.SpriteCacheMB) * 1024 * 1024
+
+    def _evict(self) -> None:
+        budget = self._budget()
+        if budget == 0:
+            return
+
+        # drop least recently used entries first, skipping the pinned one
+        # and the newest one, which is about to be played
+        for key in list(self._entries)[:-1]:
+            if self.nbytes <= budget:
+                break
+            if key == self._pinned:
+                continue
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        self._release(self._entries.pop(key))
+        self.logical_bytes -= self._sizes.pop(key)
+
+    """
+    @! ---- Shared pixmap accounting ---------------------------------------------------------------
+    """
+
+    def _new_bytes(self, frames: Frames) -> int:
+        # bytes that caching `frames` would add on top of what's already resident
+        new = {
+            f.pixmap.cacheKey(): f
+            for f in frames
+            if f.pixmap.cacheKey() not in self._refs
+        }
+        return frames_nbytes(tuple(new.values()))
+
+    def _retain(self, frames: Frames) -> None:
+        for frame in frames:
+            k = frame.pixmap.cacheKey()
+            if k not in self._refs:
+                self._refs[k] = 0
+                self.nbytes += frames_nbytes((frame,))
+            self._refs[k] += 1
+
+    def _release(self, frames: Frames) -> None:
+        for frame in frames:
+            k = frame.pixmap.cacheKey()
+            self._refs[k] -= 1
+            if self._refs[k] == 0:
+                del self._refs[k]
+                self.nbytes -= frames_nbytes((frame,))
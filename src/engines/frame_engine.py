@@ -1,39 +1,87 @@
-from PySide6.QtCore import QRect
-from PySide6.QtWidgets import QLabel
-
-from ..resources import ResourceRegistry, SpriteProperties
+from ..profiler import PROFILER
+from ..resources import ResourceRegistry
 from ..states import Direction, State
-from .sprite_engine import get_spritesheet
+from ..window.sprite_widget import SpriteWidget
+from .sprite_engine import CACHE, get_frames
+from .sprite_loader import SpriteLoader
+from .timeline import Timeline, compile_timeline
 
 
 class FrameEngine:
-    def __init__(self, qtlabel: QLabel):
-        self.qtlabel = qtlabel
+    def __init__(self, canvas: SpriteWidget):
+        self.canvas = canvas
+
+        # sheets are decoded on first use; the likely next ones in the background
+        self.loader = SpriteLoader(canvas)
+        self._playing: tuple[State, Direction] | None = None
+        self._timeline: Timeline | None = None
+        self._timeline_key: tuple[State, Direction] | None = None
 
-    def advance(self, state: State, direction: Direction = Direction.NONE) -> bool:
+    def advance(
+        self,
+        state: State,
+        direction: Direction = Direction.NONE,
+        min_hold: int = 1,
+        skip: int = 0,
+        loop: bool = True,
+    ) -> tuple[bool, int]:
         """
-        Advance the animation by one frame.
-        Returns True if the animation has completed a full loop.
+        Shows the frame due `skip` ticks after the current one (e.g. when frames were
+        missed) and skips to the next visual change, but no sooner than `min_hold`
+        ticks (frames in between are skipped). Without `loop`, nothing is shown once
+        the last frame has had its time, so the animation can end on it.
+        Returns whether the animation has completed a full loop, and how many ticks
+        the shown frame stays on screen.
         """
 
+        # on animation switch, start decoding whatever may come next
+        key = (state, direction)
+        if self._playing != key:
+            self._playing = key
+            self.loader.prefetch_next(state)
+
+        # a sheet being decoded in the background lands soon: keep the previous frame
+        # on screen until then rather than decoding it a second time here
+        CACHE.pin(key)
+        if key not in CACHE and self.loader.is_pending(key):
+            return False, 1
+
         # fetch data
-        frame_data = ResourceRegistry.animations[(state, direction)]
-        sheet = get_spritesheet(frame_data.sprite_path)
-        cur_frame = frame_data.current_frame
-        num_frame = frame_data.frame_count
-
-        # show next frame
-        w = SpriteProperties.FrameWidth
-        h = SpriteProperties.FrameHeight
-        x = (cur_frame % SpriteProperties.SpriteColumn) * w
-        y = (cur_frame // SpriteProperties.SpriteColumn) * h
-        rect = QRect(x, y, w, h)
-        self.qtlabel.setPixmap(sheet.copy(rect))
-
-        # advance frame + loop back if needed
-        frame_data.current_frame += 1
-        if frame_data.current_frame >= num_frame:
-            frame_data.current_frame = 0
-
-        # return true if playing completed a full loop
-        return frame_data.current_frame == 0
+        frame_data = ResourceRegistry.animations[key]
+        with PROFILER.section("lookup"):
+            frames = get_frames(state, direction)
+
+        # only the playing animation's timeline is kept, so it can't pin evicted frames;
+        # animations sharing a sheet share `frames`, but not their durations
+        timeline = self._timeline
+        if (
+            timeline is None
+            or timeline.source is not frames
+            or self._timeline_key != key
+        ):
+            with PROFILER.section("lookup"):
+                timeline = compile_timeline(frames, frame_data.frame_durations)
+            self._timeline = timeline
+            self._timeline_key = key
+
+        # show the frame of the current tick, which may be past the end if frames
+        # were missed
+        tick = frame_data.current_frame + skip
+        wrapped = tick >= timeline.length
+        tick %= timeline.length
+        if wrapped and not loop:
+            frame_data.current_frame = tick
+            return True, 1
+
+        run = timeline.run_at(tick)
+        with PROFILER.section("pixmap"):
+            self.canvas.show_frame(timeline.frames[run])
+
+        # jump to the next run, keeping the phase of the loop
+        hold = timeline.starts[run] + timeline.durations[run] - tick
+        hold = max(hold, min_hold)
+        # left past the end after the last run, so the next tick sees the wrap
+        frame_data.current_frame = tick + hold
+
+        # completed a full loop once the last run has had its time
+        return wrapped, hold
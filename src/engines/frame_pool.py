@@ -0,0 +1,47 @@
+import hashlib
+import weakref
+
+from PySide6.QtGui import QImage, QPixmap
+
+
+def frame_digest(image: QImage) -> bytes:
+    """Content hash of a frame's pixels (and dimensions). Thread-safe."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{image.width()}x{image.height()}:{image.format()}".encode())
+    h.update(image.constBits())
+    return h.digest()
+
+
+class FramePool:
+    """
+    Content-addressed store of frame pixmaps, shared by the whole process.
+
+    Identical pixels (held poses, sheets reused by several animations, even frames
+    of other characters) are uploaded once and the same QPixmap is handed out again.
+    A pixmap only lives as long as some cached animation still uses it.
+    """
+
+    def __init__(self) -> None:
+        self._pixmaps: weakref.WeakValueDictionary[bytes, QPixmap] = (
+            weakref.WeakValueDictionary()
+        )
+        self.lookups = 0
+        self.reused = 0
+
+    def intern(self, digest: bytes, image: QImage) -> QPixmap:
+        """Returns the pooled pixmap for `digest`, uploading `image` if there's none."""
+        self.lookups += 1
+        pixmap = self._pixmaps.get(digest)
+        if pixmap is not None:
+            self.reused += 1
+            return pixmap
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[digest] = pixmap
+        return pixmap
+
+    def stats(self) -> dict:
+        return {
+            "pixmaps": len(self._pixmaps),
+            "lookups": self.lookups,
+            "reused": self.reused,
+        }
@@ -0,0 +1,263 @@
+"""
+Persistent cache of sound effects transcoded to 16-bit PCM WAV, which QSoundEffect
+plays without decoding anything.
+
+Layout under ~/.cache/linux-desktop-gremlin/sounds/, like the sprite disk cache:
+- <content hash>-<variant hash>.wav:  the transcoded sound; the variant holds the sample
+                                      rate and channel count it was made for.
+- index/<hash of path, size, mtime, variant>:  name of the .wav file for that source.
+- format:                             "<rate> <channels>" of the last output device.
+
+Looking a sound up is pure Python; transcoding needs QtMultimedia and is only done at
+install time (see cache_warmer) or by the SoundEngine, once audio is loaded. Sounds are
+looked up again for the configured device then, and transcoded again if it changed.
+"""
+
+import io
+import math
+import os
+import sys
+import wave
+from array import array
+from pathlib import Path
+
+from PySide6.QtCore import QEventLoop, QObject, QThreadPool, QUrl, Signal
+
+from ..settings import Preferences
+from .disk_cache import digest, hash_file, write_atomic
+from .disk_cache import CACHE_DIR as SPRITE_CACHE_DIR
+
+CACHE_DIR = SPRITE_CACHE_DIR.parent / "sounds"
+
+# loudness that normalized sounds are brought to, as RMS in dBFS
+TARGET_RMS_DBFS = -20.0
+
+
+# (sample rate, channel count) that a sound is transcoded to
+AudioFormat = tuple[int, int]
+
+# used when the output device doesn't report what it prefers
+DEFAULT_FORMAT: AudioFormat = (48000, 2)
+
+
+def lookup(path: str, fmt: AudioFormat | None = None) -> str | None:
+    """
+    Path of `path` transcoded to `fmt`, or None if it's not cached yet.
+    Without `fmt`, looks for the format of the output device that was used last.
+    """
+    fmt = fmt or last_format()
+    if fmt is None:
+        return None
+    variant = _variant(fmt)
+    try:
+        data_path = CACHE_DIR / _index_file(path, variant).read_text().strip()
+        if data_path.is_file():
+            return str(data_path)
+    except OSError:
+        pass
+
+    # the source file changed or moved, but its content may still be cached
+    try:
+        data_path = _data_file(hash_file(path), variant)
+        if data_path.is_file():
+            write_atomic(_index_file(path, variant), data_path.name.encode())
+            return str(data_path)
+    except OSError:
+        pass
+    return None
+
+
+def transcode(path: str, fmt: AudioFormat) -> str | None:
+    """Transcodes `path` and waits for it; needs a Q(Core)Application."""
+    transcoder = Transcoder(path, fmt)
+    loop = QEventLoop()
+    result: list[str | None] = [None]
+
+    def on_done(_: str, cached: str | None) -> None:
+        result[0] = cached
+        loop.quit()
+
+    transcoder.done.connect(on_done)
+    transcoder.start()
+    loop.exec()
+    return result[0]
+
+
+"""
+@! ---- Output device ----------------------------------------------------------------------------
+"""
+
+
+def output_device():
+    """The QAudioDevice named by `Preferences.AudioDevice`, or None for the default."""
+    from PySide6.QtMultimedia import QMediaDevices
+
+    target = Preferences.AudioDevice
+    if target and target != "Default":
+        for device in QMediaDevices.audioOutputs():
+            if device.description() == target:
+                return device
+    return None
+
+
+def output_format(device=None) -> AudioFormat:
+    """What `device`, or the default output device, plays natively."""
+    from PySide6.QtMultimedia import QMediaDevices
+
+    fmt = (device or QMediaDevices.defaultAudioOutput()).preferredFormat()
+    if fmt.sampleRate() <= 0 or fmt.channelCount() <= 0:
+        return DEFAULT_FORMAT
+    return fmt.sampleRate(), fmt.channelCount()
+
+
+def last_format() -> AudioFormat | None:
+    """Format of the output device audio was last played on, if known."""
+    try:
+        rate, channels = map(int, (CACHE_DIR / "format").read_text().split())
+        return rate, channels
+    except (OSError, ValueError):
+        return None
+
+
+def remember_format(fmt: AudioFormat) -> None:
+    """Makes `fmt` what `lookup` looks for at the next launch."""
+    if fmt == last_format():
+        return
+    try:
+        write_atomic(CACHE_DIR / "format", f"{fmt[0]} {fmt[1]}".encode())
+    except OSError:
+        pass  # the next launch transcodes again if the device differs
+
+
+class Transcoder(QObject):
+    """
+    Decodes a sound with QAudioDecoder, then normalizes and saves it on a worker thread.
+    Emits `done(source path, cached path or None)`.
+    """
+
+    done = Signal(str, object)
+
+    def __init__(
+        self, path: str, fmt: AudioFormat, parent: QObject | None = None
+    ) -> None:
+        super().__init__(parent)
+        self.path = path
+        self.fmt = fmt
+        self._chunks: list[bytes] = []
+        self._decoder = None
+        self._emitted = False  # `done` is emitted once, whether it failed or not
+
+    def start(self) -> None:
+        from PySide6.QtMultimedia import QAudioDecoder, QAudioFormat
+
+        fmt = QAudioFormat()
+        fmt.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+        fmt.setSampleRate(self.fmt[0])
+        fmt.setChannelCount(self.fmt[1])
+
+        self._decoder = QAudioDecoder(self)
+        self._decoder.setAudioFormat(fmt)
+        self._decoder.setSource(QUrl.fromLocalFile(self.path))
+        self._decoder.bufferReady.connect(self._on_buffer)
+        self._decoder.finished.connect(self._on_finished)
+        self._decoder.error.connect(lambda *_: self._emit(None))
+        if not self._decoder.isSupported():
+            self._emit(None)
+            return
+        self._decoder.start()
+
+    def _on_buffer(self) -> None:
+        self._chunks.append(bytes(self._decoder.read().constData()))
+
+    def _on_finished(self) -> None:
+        if self._emitted:
+            return  # it failed already
+        fmt = self._decoder.audioFormat()
+        pcm = b"".join(self._chunks)
+        self._chunks = []
+        rate, channels = fmt.sampleRate(), fmt.channelCount()
+        QThreadPool.globalInstance().start(
+            lambda: self._emit(_store(self.path, self.fmt, pcm, rate, channels))
+        )
+
+    def _emit(self, cached: str | None) -> None:
+        if self._emitted:
+            return
+        self._emitted = True
+        try:
+            self.done.emit(self.path, cached)
+        except RuntimeError:
+            pass  # the transcoder is gone already
+
+
+"""
+@! ---- Encoding ---------------------------------------------------------------------------------
+"""
+
+
+def _store(
+    path: str, fmt: AudioFormat, pcm: bytes, rate: int, channels: int
+) -> str | None:
+    # caching is best-effort: an empty decode or an I/O error leaves the source as is
+    if not pcm or rate <= 0 or channels <= 0:
+        return None
+    if Preferences.SoundNormalize:
+        pcm = _normalize(pcm)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm)
+
+    try:
+        # keyed by the format asked for, which the decoder may not have matched
+        variant = _variant(fmt)
+        data_path = _data_file(hash_file(path), variant)
+        write_atomic(data_path, buffer.getvalue())
+        write_atomic(_index_file(path, variant), data_path.name.encode())
+        return str(data_path)
+    except OSError:
+        return None
+
+
+def _normalize(pcm: bytes) -> bytes:
+    """Scales 16-bit samples to TARGET_RMS_DBFS, without letting the peak clip."""
+    samples = array("h", pcm[: len(pcm) // 2 * 2])
+    if sys.byteorder == "big":
+        samples.byteswap()  # WAV is little-endian
+
+    peak = max(map(abs, samples), default=0)
+    if peak == 0:
+        return pcm
+    rms = math.sqrt(sum(s * s for s in samples) / len(samples))
+    gain = min(10 ** (TARGET_RMS_DBFS / 20) * 32768 / rms, 32767 / peak)
+    if abs(gain - 1) < 0.01:
+        return pcm
+
+    samples = array("h", (int(s * gain) for s in samples))
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+"""
+@! ---- Keys -------------------------------------------------------------------------------------
+"""
+
+
+def _variant(fmt: AudioFormat) -> str:
+    rate, channels = fmt
+    kind = "normalized" if Preferences.SoundNormalize else "pcm16"
+    return f"{kind}-{rate}hz-{channels}ch"
+
+
+def _index_file(path: str, variant: str) -> Path:
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}|{variant}"
+    return CACHE_DIR / "index" / digest(key.encode())
+
+
+def _data_file(content_hash: str, variant: str) -> Path:
+    return CACHE_DIR / f"{content_hash}-{digest(variant.encode())}.wav"
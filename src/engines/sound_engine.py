@@ -1,29 +1,65 @@
 import datetime
+import time
 
-from PySide6.QtCore import QUrl
-from PySide6.QtMultimedia import QMediaDevices, QSoundEffect
+from PySide6.QtCore import QObject, QThreadPool, QUrl, Signal
 from PySide6.QtWidgets import QWidget
 
 from ..resources import ResourceRegistry
 from ..settings import Preferences
 from ..states import State
+from . import sound_cache
 
+# a sound requested before audio is ready still plays if it's at most this old (s)
+PENDING_SOUND_TTL = 1.0
+
+
+class SoundEngine(QObject):
+    """
+    Plays the sound effect of each state.
+
+    QtMultimedia is slow to load and to initialize, so it's only imported by `start()`,
+    on a worker thread, once the first frame is on screen. Until then, only the latest
+    requested sound is kept, and it plays once audio is ready unless it got stale.
+    Gremlins without sounds, or a volume of 0, never load QtMultimedia at all.
+
+    Every sound gets its own preloaded QSoundEffect, so playing never reloads a file.
+    Up to `Preferences.SoundVoices` sounds play at once; a sound that is already
+    playing gets another effect, which shares the decoded samples of the first one.
+
+    Sounds that are not in the sound cache yet are transcoded to PCM WAV in the
+    background, one after the other, and swapped in as soon as each one is ready.
+    """
+
+    _backend_loaded = Signal()
 
-class SoundEngine:
     def __init__(self, window: QWidget):
-        self.player = QSoundEffect(window)
-        self.player.setVolume(Preferences.Volume)
+        super().__init__(window)
+        self.window = window
+        self.enabled = bool(ResourceRegistry.sounds) and Preferences.Volume > 0
+        self.ready = False
+        self._starting = False
+        self._pending: tuple[str, float] | None = None  # (path, requested at)
 
-        # Configure Audio Output Device
-        target_device = Preferences.AudioDevice
-        if target_device and target_device != "Default":
-            for device in QMediaDevices.audioOutputs():
-                if device.description() == target_device:
-                    self.player.setAudioDevice(device)
-                    print(f"Audio Output set to: {target_device}")
-                    break
+        # created once QtMultimedia is loaded
+        self._device = None
+        self._effects: dict[str, list] = {}  # path -> its QSoundEffects
+        self._voices: list = []  # playing effects, oldest first
+        self._to_transcode: list[str] = []
+        self._transcoder = None
+        self._format = sound_cache.DEFAULT_FORMAT  # of the output device, once loaded
+        self._backend_loaded.connect(self._init_player)
+
+    def start(self) -> None:
+        """Loads the audio backend in the background."""
+        if not self.enabled or self._starting:
+            return
+        self._starting = True
+        QThreadPool.globalInstance().start(self._load_backend)
 
     def play(self, state: State, delay_seconds=0):
+        if not self.enabled:
+            return
+
         # get sound data if exists
         try:
             data = ResourceRegistry.get_sound(state)
@@ -37,6 +73,118 @@ class SoundEngine:
                 return
             data.last_played = datetime.datetime.now()
 
-        # play sound
-        self.player.setSource(QUrl.fromLocalFile(data.sound_path))
-        self.player.play()
+        # play sound, or keep it for when audio is ready
+        if not self.ready:
+            self._pending = (data.sound_path, time.monotonic())
+            return
+        self._play(data.sound_path)
+
+    """
+    @! ---- Backend initialization -----------------------------------------------------------------
+    """
+
+    def _load_backend(self) -> None:
+        # worker thread: only the import, Qt objects must be created on the GUI thread
+        import PySide6.QtMultimedia  # noqa: F401
+
+        try:
+            self._backend_loaded.emit()
+        except RuntimeError:
+            pass  # the window is gone already
+
+    def _init_player(self) -> None:
+        # Configure Audio Output Device
+        self._device = sound_cache.output_device()
+        if self._device is not None:
+            print(f"Audio Output set to: {Preferences.AudioDevice}")
+
+        # the sounds found at load time were made for the device used last time
+        self._format = sound_cache.output_format(self._device)
+        sound_cache.remember_format(self._format)
+        for data in ResourceRegistry.sounds.values():
+            cached = sound_cache.lookup(data.source_path, self._format)
+            data.sound_path = cached or data.source_path
+
+        # effects load their files asynchronously, off the GUI thread
+        for path in {data.sound_path for data in ResourceRegistry.sounds.values()}:
+            self._effects[path] = [self._new_effect(path)]
+        self._to_transcode = sorted(
+            {
+                data.source_path
+                for data in ResourceRegistry.sounds.values()
+                if data.sound_path == data.source_path
+            }
+        )
+        self.ready = True
+        self._transcode_next()
+
+        # catch up on the sound requested while loading, unless it's too late for it
+        if self._pending is not None:
+            path, requested_at = self._pending
+            self._pending = None
+            if time.monotonic() - requested_at <= PENDING_SOUND_TTL:
+                self._play(path)
+
+    def _new_effect(self, path: str):
+        from PySide6.QtMultimedia import QSoundEffect
+
+        effect = QSoundEffect(self.window)
+        effect.setVolume(Preferences.Volume)
+        if self._device is not None:
+            effect.setAudioDevice(self._device)
+        effect.setSource(QUrl.fromLocalFile(path))
+        return effect
+
+    """
+    @! ---- Transcoding ----------------------------------------------------------------------------
+    """
+
+    def _transcode_next(self) -> None:
+        self._transcoder = None
+        if not self._to_transcode:
+            return
+        self._transcoder = sound_cache.Transcoder(
+            self._to_transcode.pop(0), self._format, self
+        )
+        self._transcoder.done.connect(self._on_transcoded)
+        self._transcoder.start()
+
+    def _on_transcoded(self, source: str, cached: str | None) -> None:
+        if self._transcoder is not None:
+            self._transcoder.deleteLater()
+        if cached is not None:
+            for data in ResourceRegistry.sounds.values():
+                if data.sound_path == source:
+                    data.sound_path = cached
+
+            # effects still playing the source finish first, then go
+            old = self._effects.pop(source, [])
+            self._voices = [v for v in self._voices if v not in old]
+            for effect in old:
+                if effect.isPlaying():
+                    effect.playingChanged.connect(effect.deleteLater)
+                else:
+                    effect.deleteLater()
+            self._effects[cached] = [self._new_effect(cached)]
+        self._transcode_next()
+
+    """
+    @! ---- Voices ---------------------------------------------------------------------------------
+    """
+
+    def _play(self, path: str) -> None:
+        self._voices = [v for v in self._voices if v.isPlaying()]
+        if len(self._voices) >= max(1, Preferences.SoundVoices):
+            if Preferences.SoundVoiceStealing == "none":
+                return
+            self._voices.pop(0).stop()
+
+        # any idle effect of this sound, or one more if they're all busy
+        effects = self._effects.setdefault(path, [])
+        effect = next((e for e in effects if not e.isPlaying()), None)
+        if effect is None:
+            effect = self._new_effect(path)
+            effects.append(effect)
+
+        effect.play()
+        self._voices.append(effect)
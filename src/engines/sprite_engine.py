@@ -1,23 +1,204 @@
-from typing import Dict
+from typing import Iterable, Tuple
 
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QImage, QImageReader, QTransform
 
-CACHE: Dict[str, QPixmap] = {}
+from ..profiler import PROFILER
+from ..resources import ResourceRegistry, SpriteProperties
+from ..settings import Preferences
+from ..startup_profile import STARTUP
+from ..states import Direction, State
+from . import disk_cache
+from .frame_cache import Frame, FrameCache, Frames
+from .frame_pool import FramePool, frame_digest
 
+# a decoded frame: its trimmed pixels, their offset inside the window, and their hash
+DecodedFrame = Tuple[QImage, int, int, bytes]
+DecodedFrames = Tuple[DecodedFrame, ...]
 
-def get_spritesheet(path: str):
-    """Gets a QPixmap from cache or loads it from disk."""
+# maps (state, direction) to the pre-sliced frames of its animation,
+# already resampled to the window size given by `Preferences.Scale`
+CACHE = FrameCache()
+
+# identical frames, within or across animations and characters, share one pixmap
+POOL = FramePool()
+
+PROFILER.add_stats("frame_cache", CACHE.stats)
+PROFILER.add_stats("frame_pool", POOL.stats)
+
+
+def get_frames(state: State, direction: Direction = Direction.NONE) -> Frames:
+    """Gets the frames of an animation from cache or slices them from its spritesheet."""
 
     # check cache first
-    if path in CACHE:
-        return CACHE[path]
+    key = (state, direction)
+    frames = CACHE.get(key)
+    if frames is not None:
+        return frames
+
+    # animations that share a spritesheet (e.g. Emote & Poke) share their frames too
+    data = ResourceRegistry.get_animation(state, direction)
+    frames = find_shared_frames(data.sprite_path, data.frame_count)
 
     # load from disk & save to cache if not cached
+    if frames is None:
+        frames = to_pixmaps(decode_frames(data.sprite_path, data.frame_count))
+    CACHE.put(key, frames)
+    return frames
+
+
+def decode_frames(path: str, frame_count: int) -> DecodedFrames:
+    """
+    Decodes a spritesheet, cuts it into `frame_count` frames of window size
+    and trims their transparent padding.
+    Only QImage is involved, so this is safe to call off the GUI thread.
+    """
+    with PROFILER.section("decode"):
+        frames = _decode_frames(path, frame_count)
+    STARTUP.mark("first_decode")
+    return frames
+
+
+def _decode_frames(path: str, frame_count: int) -> DecodedFrames:
+    if not Preferences.SpriteDiskCache:
+        return _slice_frames(_load_sprite(path), frame_count)
+
+    # slice straight out of the mapped disk cache if the sheet was decoded before
+    variant = _decode_variant()
+    with disk_cache.open_image(path, variant) as sheet:
+        if sheet is not None:
+            return _slice_frames(sheet, frame_count)
+
     sheet = _load_sprite(path)
-    CACHE[path] = sheet
-    return sheet
+    disk_cache.store_image(path, variant, sheet)
+    return _slice_frames(sheet, frame_count)
+
+
+def prefill_disk_cache() -> int:
+    """
+    Decodes every registered spritesheet into the disk cache ahead of time.
+    Returns the number of sheets that were not cached yet.
+    """
+    variant = _decode_variant()
+    added = 0
+    for path in {data.sprite_path for data in ResourceRegistry.animations.values()}:
+        if not disk_cache.contains(path, variant):
+            sheet = _load_sprite(path)
+            if not sheet.isNull():
+                disk_cache.store_image(path, variant, sheet)
+                added += 1
+    return added
+
+
+def to_pixmaps(decoded: Iterable[DecodedFrame]) -> Frames:
+    """Uploads decoded frames as pixmaps. Must be called on the GUI thread."""
+    return tuple(Frame(POOL.intern(d, img), x, y) for img, x, y, d in decoded)
+
+
+def find_shared_frames(path: str, frame_count: int) -> Frames | None:
+    """Finds cached frames of another animation that uses the same spritesheet."""
+    for key, frames in CACHE.items():
+        data = ResourceRegistry.animations.get(key)
+        if data is not None and data.sprite_path == path and len(frames) >= frame_count:
+            return frames[:frame_count]
+    return None
+
+
+def scaled_frame_size() -> tuple[int, int]:
+    """Size of a single frame on screen, i.e. the size of the gremlin window."""
+    scale = Preferences.Scale
+    w = max(1, int(SpriteProperties.FrameWidth * scale))
+    h = max(1, int(SpriteProperties.FrameHeight * scale))
+    return w, h
+
+
+def _load_sprite(path: str) -> QImage:
+    """
+    Loads a sprite sheet from disk.
+    When downscaling, the sheet is decoded directly at the reduced size so the
+    full-resolution image never stays in memory.
+    Returns a null image if the file can't be decoded.
+    """
+    reader = QImageReader(path)
+    src = reader.size()
+    if Preferences.Scale < 1.0 and src.isValid():
+        w, h = scaled_frame_size()
+        fw = SpriteProperties.FrameWidth
+        fh = SpriteProperties.FrameHeight
+        reader.setScaledSize(
+            QSize(round(src.width() * w / fw), round(src.height() * h / fh))
+        )
+    sheet = reader.read()
+    if sheet.isNull():
+        print(f"Could not decode spritesheet {path}: {reader.errorString()}")
+        return sheet
+    return sheet.convertToFormat(disk_cache.IMAGE_FORMAT)
+
+
+def _decode_variant() -> str:
+    # sheets are only decoded at a different size when downscaling
+    if Preferences.Scale >= 1.0:
+        return "full"
+    w, h = scaled_frame_size()
+    return f"{w}x{h}/{SpriteProperties.FrameWidth}x{SpriteProperties.FrameHeight}"
+
+
+def _slice_frames(sheet: QImage, frame_count: int) -> DecodedFrames:
+    """Cuts a spritesheet into `frame_count` trimmed frames of window size."""
+    if sheet.isNull():
+        # an unreadable sheet plays as empty frames, like a missing one did
+        blank = QImage(1, 1, disk_cache.IMAGE_FORMAT)
+        blank.fill(0)
+        return ((blank, 0, 0, frame_digest(blank)),) * frame_count
+
+    w, h = scaled_frame_size()
+
+    # cell size inside the sheet, which is already scaled if it was decoded smaller
+    cw, ch = SpriteProperties.FrameWidth, SpriteProperties.FrameHeight
+    if Preferences.Scale < 1.0:
+        cw, ch = w, h
+    cols = SpriteProperties.SpriteColumn
+
+    frames = []
+    for i in range(frame_count):
+        frame = sheet.copy(QRect((i % cols) * cw, (i // cols) * ch, cw, ch))
+        if (cw, ch) != (w, h):
+            frame = frame.scaled(
+                w,
+                h,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        frames.append(_trim(frame))
+    return tuple(frames)
+
+
+def _trim(frame: QImage) -> DecodedFrame:
+    """
+    Crops `frame` to the bounding box of its non-transparent pixels and hashes it.
+    In premultiplied ARGB32 a pixel is transparent iff all of its bytes are zero,
+    so the box can be found by stripping zero bytes off the raw buffer.
+    """
+    if frame.format() != disk_cache.IMAGE_FORMAT:
+        frame = frame.convertToFormat(disk_cache.IMAGE_FORMAT)
+
+    top, bottom = _opaque_rows(frame)
+    if top > bottom:
+        # fully transparent, keep a single pixel so there's still something to paint
+        frame = frame.copy(0, 0, 1, 1)
+        return frame, 0, 0, frame_digest(frame)
+
+    # columns are the rows of the frame rotated by 90 degrees
+    left, right = _opaque_rows(frame.transformed(QTransform().rotate(90)))
+    rect = QRect(left, top, right - left + 1, bottom - top + 1)
+    frame = frame.copy(rect)
+    return frame, rect.x(), rect.y(), frame_digest(frame)
 
 
-def _load_sprite(path: str):
-    """Loads a sprite sheet from disk."""
-    return QPixmap(path)
+def _opaque_rows(image: QImage) -> tuple[int, int]:
+    # first & last row holding a non-zero byte; first > last if there's none
+    data = bytes(image.constBits())
+    bpl = image.bytesPerLine()
+    first = len(data) - len(data.lstrip(b"\0"))
+    last = len(data.rstrip(b"\0")) - 1
+    return first // bpl, last // bpl
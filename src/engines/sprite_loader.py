@@ -0,0 +1,139 @@
+from typing import Callable, Dict, Hashable, Iterable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from ..resources import ResourceRegistry
+from ..states import Direction, State, next_states
+from .sprite_engine import (
+    CACHE,
+    DecodedFrames,
+    decode_frames,
+    find_shared_frames,
+    scaled_frame_size,
+    to_pixmaps,
+)
+
+
+class _DecodeJob(QRunnable):
+    """Decodes one animation on a worker thread and posts the result back."""
+
+    def __init__(self, loader: "SpriteLoader", key: Hashable, path: str, count: int):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.path = path
+        self.count = count
+
+    def run(self) -> None:
+        # a failed decode still posts a result, so that the key stops being pending
+        # and its waiters run; they decode it again on the GUI thread, if needed
+        try:
+            decoded = decode_frames(self.path, self.count)
+        except Exception as e:
+            print(f"Could not decode {self.path}: {e!r}")
+            decoded = None
+
+        # emitted from the worker thread --> queued to the loader's (GUI) thread
+        try:
+            self.loader.decoded.emit(self.key, decoded)
+        except RuntimeError:
+            pass  # the loader was destroyed while shutting down
+
+
+class SpriteLoader(QObject):
+    """
+    Decodes spritesheets on a pool of worker threads before they are needed.
+
+    Only QImages are produced by the workers; they are turned into pixmaps and put into
+    the sprite cache on the GUI thread as they arrive.
+    """
+
+    decoded = Signal(object, object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        # one worker per core (QThreadPool's default)
+        self.pool = QThreadPool(self)
+        self._pending: set[Hashable] = set()
+        self._waiters: Dict[Hashable, list[Callable[[], None]]] = {}
+        self.decoded.connect(self._on_decoded)
+
+    def preload_startup(self) -> None:
+        """
+        Decodes the animations played right after launch in parallel. The rest are
+        prefetched once the state they may follow plays (see FrameEngine).
+        """
+        self.prefetch((s, Direction.NONE) for s in (State.INTRO, State.IDLE))
+
+    def when_ready(
+        self, key: tuple[State, Direction], callback: Callable[[], None]
+    ) -> None:
+        """
+        Calls `callback` on the GUI thread once the frames of `key` are cached,
+        decoding them in the background if needed.
+        """
+        if key in CACHE or key not in ResourceRegistry.animations:
+            callback()
+            return
+        self._waiters.setdefault(key, []).append(callback)
+        if key not in self._pending:
+            self._submit(key)
+
+    def is_pending(self, key: tuple[State, Direction]) -> bool:
+        """True while `key` is being decoded in the background."""
+        return key in self._pending
+
+    def prefetch_next(self, state: State) -> None:
+        """Prefetches every animation that can be played right after `state`."""
+        keys = []
+        for nxt in next_states(state):
+            keys.extend(_animation_keys(nxt))
+        self.prefetch(keys)
+
+    def prefetch(self, keys: Iterable[tuple[State, Direction]]) -> None:
+        """Queues animations for background decoding, in the given order."""
+        for key in keys:
+            if key in CACHE or key in self._pending:
+                continue
+            data = ResourceRegistry.animations.get(key)
+            if data is None:
+                continue
+
+            # no need to decode a sheet that is already sliced for another animation
+            shared = find_shared_frames(data.sprite_path, data.frame_count)
+            if shared is not None:
+                CACHE.put(key, shared, speculative=True)
+                continue
+
+            # don't bother decoding what the cache won't keep
+            w, h = scaled_frame_size()
+            if not CACHE.fits(data.frame_count * w * h * 4):
+                continue
+
+            self._submit(key)
+
+    def stop(self) -> None:
+        """Drops queued decodes and waits for running ones (called on shutdown)."""
+        self.pool.clear()
+        self.pool.waitForDone()
+
+    def _submit(self, key: Hashable) -> None:
+        data = ResourceRegistry.animations[key]
+        self._pending.add(key)
+        self.pool.start(_DecodeJob(self, key, data.sprite_path, data.frame_count))
+
+    def _on_decoded(self, key: Hashable, decoded: DecodedFrames | None) -> None:
+        self._pending.discard(key)
+        waiters = self._waiters.pop(key, [])
+
+        # frames somebody is waiting for are about to play, so they are not speculative
+        if decoded is not None and key not in CACHE:
+            CACHE.put(key, to_pixmaps(decoded), speculative=not waiters)
+        for callback in waiters:
+            callback()
+
+
+def _animation_keys(state: State) -> list[tuple[State, Direction]]:
+    if state == State.WALK:
+        return [(state, d) for d in Direction if d != Direction.NONE]
+    return [(state, Direction.NONE)]
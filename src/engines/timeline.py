@@ -0,0 +1,47 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+from .frame_cache import Frame, Frames
+
+
+@dataclass(frozen=True)
+class Timeline:
+    """
+    An animation compiled into runs: `frames[i]` is on screen from tick `starts[i]`
+    for `durations[i]` ticks. Consecutive identical frames are merged into one run,
+    so the animation only needs to wake up when the picture actually changes.
+    """
+
+    source: Frames
+    frames: Tuple[Frame, ...]
+    starts: Tuple[int, ...]
+    durations: Tuple[int, ...]
+    length: int  # in ticks
+
+    def run_at(self, tick: int) -> int:
+        """Index of the run that is on screen at `tick`."""
+        return bisect_right(self.starts, tick) - 1
+
+
+def compile_timeline(frames: Frames, durations: Sequence[int] = ()) -> Timeline:
+    """
+    Compiles `frames` into a timeline. `durations` optionally gives how many ticks
+    each frame stays on screen (1 tick each by default).
+    """
+    runs: list[Frame] = []
+    starts: list[int] = []
+    lengths: list[int] = []
+
+    tick = 0
+    for i, frame in enumerate(frames):
+        duration = durations[i] if i < len(durations) else 1
+        if runs and runs[-1] == frame:
+            lengths[-1] += duration
+        else:
+            runs.append(frame)
+            starts.append(tick)
+            lengths.append(duration)
+        tick += duration
+
+    return Timeline(frames, tuple(runs), tuple(starts), tuple(lengths), tick)
@@ -1,32 +1,91 @@
+import math
 from typing import Callable
 
 from ..engines import FrameEngine
-from ..states import EndByFrameAnimations
+from ..profiler import PROFILER
+from ..resources import SpriteProperties
+from ..settings import Preferences
+from ..states import EndByFrameAnimations, to_pascal_case
 from .state_manager import State, StateManager
 
 
+def frame_rate_cap(state: State) -> float:
+    """
+    Max frame rate of `state` (0 if uncapped).
+    A cap in `sprite-map.json` overrides the one in `config.json`.
+    """
+    key = to_pascal_case(state)
+    return SpriteProperties.FrameRateCaps.get(
+        key, Preferences.FrameRateCaps.get(key, 0)
+    )
+
+
+def min_hold(state: State) -> int:
+    """Ticks each frame of `state` must stay on screen to respect its frame-rate cap."""
+    cap = frame_rate_cap(state)
+    tick_rate = SpriteProperties.FrameRate * Preferences.AnimationSpeed
+    if cap <= 0 or cap >= tick_rate:
+        return 1
+    return math.ceil(tick_rate / cap)
+
+
 class AnimationTicker:
 
     def __init__(
         self,
         state_manager: StateManager,
         frame_engine: FrameEngine,
-        upd_position: Callable[[], None],
+        upd_position: Callable[[], bool],
     ):
         self.state_manager = state_manager
         self.frame_engine = frame_engine
-        self.upd_position = upd_position
+        self.upd_position = upd_position  # returns True while still in motion
+        self._gliding = False
+        self._frame_wait = 0  # ticks left after the next tick until the frame changes
 
-    def tick(self):
-        # advance animation by 1 frame
+    def reset(self) -> None:
+        """Makes the next tick show a frame, e.g. once the animation was restarted."""
+        self._frame_wait = 0
+
+    def tick(self, skip: int = 0) -> int:
+        """
+        Plays the current frame of the animation, `skip` ticks ahead of schedule.
+        Returns how many ticks may pass before the next tick is needed.
+        """
+        PROFILER.begin_tick()
         cur_state = self.state_manager.current_state
         cur_direc = self.state_manager.current_direction
-        end_frame = self.frame_engine.advance(cur_state, cur_direc)
+
+        # window position must be updated every tick while moving, including while
+        # slowing down after a walk, unless the gremlin is grabbed
+        moving = cur_state == State.WALK or (self._gliding and cur_state != State.GRAB)
+
+        # advance animation up to its next visual change, unless it isn't due yet
+        # because the position was updated in between; animations that end by frame
+        # stay on their last frame until they complete
+        if skip < self._frame_wait:
+            end_frame, hold = False, self._frame_wait - skip
+        else:
+            end_frame, hold = self.frame_engine.advance(
+                cur_state,
+                cur_direc,
+                min_hold(cur_state),
+                skip - self._frame_wait,
+                loop=cur_state not in EndByFrameAnimations,
+            )
+        next_tick = 1 if moving else hold
+        self._frame_wait = hold - next_tick
 
         # check for animation completion
         if end_frame and cur_state in EndByFrameAnimations:
             self.state_manager.on_completion()
 
         # window position update callback
-        if cur_state == State.WALK:
-            self.upd_position()
+        if moving:
+            with PROFILER.section("move"):
+                self._gliding = self.upd_position()
+        else:
+            self._gliding = False
+
+        PROFILER.end_tick()
+        return next_tick
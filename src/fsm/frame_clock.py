@@ -0,0 +1,48 @@
+import math
+import time
+
+from ..resources import SpriteProperties
+from ..settings import Preferences
+
+
+class FrameClock:
+    """
+    Maps monotonic time to animation ticks.
+
+    Tick `n` is due exactly `n` periods after the clock was (re)started, so timer
+    rounding and late wakeups never accumulate: a late tick only shifts that tick,
+    and ticks that were missed entirely are reported so their frames can be skipped.
+    """
+
+    def __init__(self) -> None:
+        self._epoch = time.monotonic_ns()
+        self._tick = 0  # the tick that is scheduled (or being played)
+
+    def period_ns(self) -> float:
+        # exact, so any `AnimationSpeed` keeps its ratio to the sprite's frame rate
+        return 1e9 / (SpriteProperties.FrameRate * Preferences.AnimationSpeed)
+
+    def restart(self) -> None:
+        """Makes tick 0 due now, e.g. when a new animation starts."""
+        self._epoch = time.monotonic_ns()
+        self._tick = 0
+
+    def catch_up(self) -> int:
+        """
+        Moves to the tick that is due now.
+        Returns how many ticks were missed since the scheduled one (0 when on time).
+        """
+        due = int((time.monotonic_ns() - self._epoch) // self.period_ns())
+        missed = max(0, due - self._tick)
+        self._tick += missed
+        return missed
+
+    def lateness_ns(self) -> int:
+        """How long ago the current tick was due."""
+        return time.monotonic_ns() - int(self._epoch + self._tick * self.period_ns())
+
+    def schedule(self, ticks: int) -> int:
+        """Moves `ticks` ahead and returns how many ms are left until that tick."""
+        self._tick += ticks
+        deadline = self._epoch + self._tick * self.period_ns()
+        return max(0, math.ceil((deadline - time.monotonic_ns()) / 1e6))
@@ -0,0 +1,155 @@
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from PySide6.QtCore import Qt, QTimer
+
+# deadlines further away than this are minute-scale events: they may fire slightly
+# late, by up to COARSE_SLACK of their delay, so the OS can batch their wakeups
+COARSE_AFTER_MS = 1000
+COARSE_SLACK = 0.05
+
+
+@dataclass(slots=True)
+class Deadline:
+    name: str
+    due_ns: int
+    slack_ns: int
+    callback: Callable[[], None]
+    interval_ms: int  # > 0 for repeating deadlines
+    seq: int
+
+
+class DeadlineScheduler:
+    """
+    Named deadlines on a single OS timer.
+
+    Deadlines live in a min-heap. Rescheduling or cancelling a name only replaces
+    its entry in `_entries`; the stale heap item is dropped when it surfaces, so
+    both are O(log n). The timer is only re-armed when the earliest deadline moves.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Deadline] = {}
+        self._heap: List[Tuple[int, int, str]] = []  # (due_ns, seq, name)
+        self._seq = itertools.count()
+        self._armed: Tuple[int, int] | None = None  # heap key the timer is armed for
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+    def schedule(
+        self,
+        name: str,
+        delay_ms: int,
+        callback: Callable[[], None],
+        repeat: bool = False,
+    ) -> None:
+        """(Re)schedules `name` to call `callback` in `delay_ms`, every `delay_ms` if `repeat`."""
+        delay_ms = max(0, delay_ms)
+        slack = delay_ms * COARSE_SLACK if delay_ms > COARSE_AFTER_MS else 0
+        entry = Deadline(
+            name=name,
+            due_ns=time.monotonic_ns() + delay_ms * 1_000_000,
+            slack_ns=int(slack * 1_000_000),
+            callback=callback,
+            interval_ms=delay_ms if repeat else 0,
+            seq=next(self._seq),
+        )
+        self._entries[name] = entry
+        heapq.heappush(self._heap, (entry.due_ns, entry.seq, name))
+        self._compact()
+        self._rearm()
+
+    def cancel(self, name: str) -> None:
+        if self._entries.pop(name, None) is not None:
+            self._rearm()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._heap.clear()
+        self._armed = None
+        self._timer.stop()
+
+    def is_pending(self, name: str) -> bool:
+        return name in self._entries
+
+    def remaining_ms(self, name: str) -> int | None:
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        return max(0, math.ceil((entry.due_ns - time.monotonic_ns()) / 1e6))
+
+    def pending(self) -> List[Tuple[str, int]]:
+        """Lists pending deadlines as (name, ms left), earliest first."""
+        names = sorted(self._entries, key=lambda n: self._entries[n].due_ns)
+        return [(name, self.remaining_ms(name)) for name in names]
+
+    """
+    @! ---- Dispatch ------------------------------------------------------------------------------
+    """
+
+    def _fire(self) -> None:
+        self._armed = None
+        now = time.monotonic_ns()
+
+        # pop everything that is due, then run it: callbacks may reschedule freely
+        due: List[Deadline] = []
+        while self._heap:
+            key = self._peek()
+            if key is None or key[0] > now:
+                break
+            heapq.heappop(self._heap)
+            entry = self._entries.pop(key[2])
+            due.append(entry)
+        due.sort(key=lambda e: e.due_ns)
+
+        for entry in due:
+            if entry.interval_ms > 0:
+                self.schedule(entry.name, entry.interval_ms, entry.callback, True)
+            entry.callback()
+        self._rearm()
+
+    def _peek(self) -> Tuple[int, int, str] | None:
+        # earliest heap item that is still current, dropping stale ones
+        while self._heap:
+            key = self._heap[0]
+            entry = self._entries.get(key[2])
+            if entry is not None and entry.seq == key[1]:
+                return key
+            heapq.heappop(self._heap)
+        return None
+
+    def _rearm(self) -> None:
+        key = self._peek()
+        if key is None:
+            self._armed = None
+            self._timer.stop()
+            return
+        if self._armed == key[:2] and self._timer.isActive():
+            return
+
+        # a coarse timer may fire up to 5% of its interval early or late: if it fires
+        # early, nothing is due yet and the rest, within the slack, is waited precisely
+        entry = self._entries[key[2]]
+        left_ns = key[0] - time.monotonic_ns()
+        delay_ms = max(0, math.ceil(left_ns / 1e6))
+        self._timer.setTimerType(
+            Qt.TimerType.CoarseTimer
+            if entry.slack_ns > 0 and left_ns > entry.slack_ns
+            else Qt.TimerType.PreciseTimer
+        )
+        self._timer.start(delay_ms)
+        self._armed = key[:2]
+
+    def _compact(self) -> None:
+        # input resets minute-scale deadlines all the time; don't let their stale
+        # heap items pile up until they'd surface
+        if len(self._heap) <= 2 * len(self._entries) + 16:
+            return
+        self._heap = [(e.due_ns, e.seq, e.name) for e in self._entries.values()]
+        heapq.heapify(self._heap)
@@ -11,16 +11,19 @@ class StateManager:
         sound_engine: SoundEngine,
         is_under_mouse: Callable[[], bool],
         on_exit: Callable[[], None],
+        on_animation_reset: Callable[[], None],
     ) -> None:
         """
         Manages the current state of the gremlin and handles state transitions.
 
         Parameters
         ----------
-        sound_engine:    Plays audio on state transitions.
-        is_under_mouse:  Returns True when the gremlin window is under the cursor.
-        on_exit:         Called when the OUTRO animation completes; caller should
-                         terminate the application (e.g. QApplication.quit()).
+        sound_engine:        Plays audio on state transitions.
+        is_under_mouse:      Returns True when the gremlin window is under the cursor.
+        on_exit:             Called when the OUTRO animation completes; caller should
+                             terminate the application (e.g. QApplication.quit()).
+        on_animation_reset:  Called when an animation restarts from its first frame,
+                             so the frame that was on screen can be cut short.
         """
         self.current_state = State.IDLE
         self.current_direction = Direction.NONE
@@ -29,6 +32,7 @@ class StateManager:
         self.sound_engine = sound_engine
         self.is_under_mouse = is_under_mouse
         self.on_exit = on_exit
+        self.on_animation_reset = on_animation_reset
 
         # shooting animation for Blue Archive characters
         self.has_reload = SpriteProperties.HasReloadAnimation
@@ -115,11 +119,12 @@ class StateManager:
 
         # if passed the first quarter of the animation, allow shooting
         frame_data = ResourceRegistry.get_animation(state, Direction.NONE)
-        return frame_data.frame_count // 4 < frame_data.current_frame
+        return frame_data.length // 4 < frame_data.current_frame
 
     def _reset_current_frame(self, state: State, direction: Direction) -> None:
         data = ResourceRegistry.get_animation(state, direction)
         data.current_frame = 0
+        self.on_animation_reset()
 
     def _check_reload(self) -> None:
         if self.has_reload and self.ammo == 0:
@@ -1,11 +1,11 @@
 import random
 
-from PySide6.QtCore import QTimer
-
-from ..resources import SpriteProperties
+from ..profiler import PROFILER
 from ..settings import EmotePreferences, Preferences
 from ..states import AllowedEmoteStates, State
 from .animation_ticker import AnimationTicker
+from .frame_clock import FrameClock
+from .scheduler import DeadlineScheduler
 from .state_manager import StateManager
 
 
@@ -20,58 +20,50 @@ class TimerManager:
         animation_ticker: AnimationTicker,
     ) -> None:
         """
-        List of timers
-        - master_timer:     Each tick updates one animation frame.
-        - idle_timer:       Time spent idle; Tick fires sleep animation.
-        - sleep_timer:      Time spent sleeping; Tick fires idle animation.
-        - walk_idle_timer:  Time since last walking; Tick fires idle animation.
-        - emote_timer:      Tick triggers emote animation.
-        - emote_dur_timer:  Time spent emoting; Tick triggers idle animation.
+        List of timers, all deadlines of a single `scheduler`
+        - master:     Each tick shows one animation frame, then sleeps until the
+                      frame changes. Deadlines come from `frame_clock`.
+        - idle:       Time spent idle; Tick fires sleep animation.
+        - sleep:      Time spent sleeping; Tick fires idle animation.
+        - walk_idle:  Time since last walking; Tick fires idle animation.
+        - emote:      Tick triggers emote animation.
+        - emote_dur:  Time spent emoting; Tick triggers idle animation.
         """
 
         self.state_manager = state_manager
+        self.animation_ticker = animation_ticker
+        self.frame_clock = FrameClock()
+        self.scheduler = DeadlineScheduler()
 
-        self.master_timer = QTimer()
-        self.idle_timer = QTimer()
-        self.sleep_timer = QTimer()
-        self.walk_idle_timer = QTimer()
-        self.emote_timer = QTimer()
-        self.emote_dur_timer = QTimer()
-
-        self.walk_idle_timer.setSingleShot(True)
-        self.emote_dur_timer.setSingleShot(True)
-
-        self.master_timer.timeout.connect(animation_ticker.tick)
-        self.idle_timer.timeout.connect(self.tick_idle_timer)
-        self.sleep_timer.timeout.connect(self.tick_sleep_timer)
-        self.walk_idle_timer.timeout.connect(self.tick_walk_idle_timer)
-        self.emote_timer.timeout.connect(self.tick_emote_timer)
-        self.emote_dur_timer.timeout.connect(self.tick_emote_dur_timer)
+        # seeded when sessions are recorded or replayed, so emotes come at the same times
+        self.rng = random.Random()
 
     def stop_all(self) -> None:
         """
         Stop every timer (called on shutdown).
         """
-        for timer in (
-            self.master_timer,
-            self.idle_timer,
-            self.sleep_timer,
-            self.walk_idle_timer,
-            self.emote_timer,
-            self.emote_dur_timer,
-        ):
-            timer.stop()
+        self.scheduler.clear()
 
     """
     @! ---- Package Timer Kickoffs -----------------------------------------------------------------
     """
 
     def start_passive_timer(self) -> None:
-        base_interval = 1000 // SpriteProperties.FrameRate
-        adjusted_interval = int(base_interval / Preferences.AnimationSpeed)
-        self.master_timer.start(max(1, adjusted_interval))
+        self.frame_clock.restart()
+        self.scheduler.schedule("master", 0, self.tick_master_timer)
         self.reset_passive_timer()
 
+    def wake_master_timer(self) -> None:
+        """
+        Restarts the frame clock for a new animation and makes its first frame due
+        within one tick, e.g. after a state change interrupted a frame that was meant
+        to stay on screen longer.
+        """
+        self.frame_clock.restart()
+        if self.scheduler.is_pending("master"):
+            delay = self.frame_clock.schedule(1)
+            self.scheduler.schedule("master", delay, self.tick_master_timer)
+
     def reset_passive_timer(self) -> None:
         self.reset_idle_timer()
         self.reset_emote_timer()
@@ -82,15 +74,15 @@ class TimerManager:
 
     def reset_idle_timer(self) -> None:
         timeout = _mins2ms(Preferences.IdleMinutes)
-        self.idle_timer.start(timeout)
+        self.scheduler.schedule("idle", timeout, self.tick_idle_timer, repeat=True)
 
     def reset_sleep_timer(self) -> None:
         timeout = _mins2ms(Preferences.SleepMinutes)
-        self.sleep_timer.start(timeout)
+        self.scheduler.schedule("sleep", timeout, self.tick_sleep_timer, repeat=True)
 
     def reset_walk_idle_timer(self) -> None:
         timeout = 2000
-        self.walk_idle_timer.start(timeout)
+        self.scheduler.schedule("walk_idle", timeout, self.tick_walk_idle_timer)
 
     def reset_emote_timer(self) -> None:
         min_ms = _mins2ms(EmotePreferences.MinEmoteTriggerMinutes)
@@ -100,17 +92,29 @@ class TimerManager:
         min_ms = max(10000, min_ms)
         max_ms = max(min_ms, max_ms)
 
-        timeout = random.randint(min_ms, max_ms)
-        self.emote_timer.start(timeout)
+        timeout = self.rng.randint(min_ms, max_ms)
+        self.scheduler.schedule("emote", timeout, self.tick_emote_timer, repeat=True)
 
     def reset_emote_dur_timer(self) -> None:
         timeout = EmotePreferences.EmoteDuration
-        self.emote_dur_timer.start(timeout)
+        self.scheduler.schedule("emote_dur", timeout, self.tick_emote_dur_timer)
 
     """
     @! ---- Timer Tick -----------------------------------------------------------------------------
     """
 
+    def tick_master_timer(self) -> None:
+        # when the event loop stalled, skip the missed frames instead of running slow
+        missed = self.frame_clock.catch_up()
+        if PROFILER.enabled:
+            PROFILER.record("late", max(0, self.frame_clock.lateness_ns()))
+        if missed:
+            PROFILER.count("missed_deadlines")
+            PROFILER.count("skipped_ticks", missed)
+        hold = self.animation_ticker.tick(missed)
+        delay = self.frame_clock.schedule(hold)
+        self.scheduler.schedule("master", delay, self.tick_master_timer)
+
     def tick_idle_timer(self) -> None:
         if self.state_manager.current_state == State.IDLE:
             self.state_manager.transition_to(State.SLEEP)
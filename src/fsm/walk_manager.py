@@ -1,3 +1,5 @@
+import time
+
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QKeyEvent
 
@@ -16,6 +18,13 @@ DirectionMap = {
     (+1, +1): Direction.DOWN_RIGHT,
 }
 
+# MoveSpeed is in pixels per frame at this frame rate, as it was before walking was
+# time-based; walking speed no longer depends on the character's frame rate
+MOVE_SPEED_FPS = 60
+
+# a longer gap between updates (s) restarts the motion instead of jumping ahead
+MAX_STEP = 0.25
+
 
 class WalkManager:
     def __init__(self):
@@ -25,26 +34,63 @@ class WalkManager:
         self.s = False
         self.d = False
 
-        # move speed (pixel per frame)
-        self.v = Preferences.MoveSpeed
+        # move speed (px/s) and how fast it's reached (px/s², 0 for instantly)
+        self.v = float(Preferences.MoveSpeed * MOVE_SPEED_FPS)
+        self.accel = Preferences.MoveAcceleration
+
+        # sub-pixel motion, while moving
+        self._pos: tuple[float, float] | None = None
+        self._vel = (0.0, 0.0)
+        self._last_step = 0.0
 
     """
     @! ---- Movement Resolves ----------------------------------------------------------------------
     """
 
-    def get_velocity(self) -> tuple[int, int]:
+    def get_velocity(self) -> tuple[float, float]:
         """
-        Returns the velocity vector based on the current key states.
+        Returns the velocity (vx, vy) in px/s that the current key states ask for,
+        which `step` accelerates towards.
         If both keys in a direction are pressed, they cancel each other out.
         """
-        vy = 0
-        vx = 0
+        vy = 0.0
+        vx = 0.0
         if self.w ^ self.s:
             vy = -self.v if self.w else self.v
         if self.a ^ self.d:
             vx = -self.v if self.a else self.v
         return vx, vy
 
+    def step(self, x: int, y: int) -> tuple[int, int] | None:
+        """
+        Integrates the motion from window position (x, y) over the time elapsed since
+        the last step. Returns the new position, or None if it's the same pixel.
+        """
+        now = time.monotonic()
+        dt = now - self._last_step
+        self._last_step = now
+
+        # starting out, or the window was moved by something else (like dragging)
+        if self._pos is None or dt > MAX_STEP:
+            self._pos, self._vel, dt = (float(x), float(y)), (0.0, 0.0), 0.0
+        elif (round(self._pos[0]), round(self._pos[1])) != (x, y):
+            self._pos = (float(x), float(y))
+
+        target = self.get_velocity()
+        self._vel = (
+            _approach(self._vel[0], target[0], self.accel, dt),
+            _approach(self._vel[1], target[1], self.accel, dt),
+        )
+        self._pos = (self._pos[0] + self._vel[0] * dt, self._pos[1] + self._vel[1] * dt)
+        new_pos = (round(self._pos[0]), round(self._pos[1]))
+        if not self.in_motion():
+            self._pos = None
+        return new_pos if new_pos != (x, y) else None
+
+    def in_motion(self) -> bool:
+        """True while walking, or slowing down after it."""
+        return self.is_moving() or self._vel != (0.0, 0.0)
+
     def is_moving(self) -> bool:
         """
         Returns True if either vertical or horizontal movement is occurring.
@@ -101,3 +147,12 @@ class WalkManager:
         self.a = False
         self.s = False
         self.d = False
+
+
+def _approach(value: float, target: float, accel: float, dt: float) -> float:
+    # without acceleration, the target velocity is reached at once
+    if accel <= 0:
+        return float(target)
+    if value < target:
+        return min(value + accel * dt, target)
+    return max(value - accel * dt, target)
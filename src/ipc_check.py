@@ -0,0 +1,208 @@
+"""
+Checks the compositor IPC positioners against local stand-ins of their sockets.
+
+    python -m src.ipc_check [--moves N] [--reply-ms MS] [--refuse] [--out FILE]
+
+Serves a fake niri, sway and Hyprland socket, each with its compositor's framing and
+replies, and moves a window through every positioner as fast as a drag would. Prints
+a JSON report per backend: the moves requested, the requests and connections the
+socket saw, and whether the last request carried the final position. With --refuse,
+every request is answered with an error, which the positioner must report once.
+"""
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+# must be set before Qt is loaded
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QObject, QTimer  # noqa: E402
+from PySide6.QtNetwork import QLocalServer, QLocalSocket  # noqa: E402
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+from .window.positioning.hyprland import HyprlandPositioner  # noqa: E402
+from .window.positioning.ipc import IpcPositioner  # noqa: E402
+from .window.positioning.niri import NiriPositioner  # noqa: E402
+from .window.positioning.sway import SwayPositioner  # noqa: E402
+from .window.screen_index import ScreenIndex  # noqa: E402
+
+# splits the requests off the start of a buffer: ([(request, reply)], rest)
+Framing = Callable[[bytes, bool], tuple[list[tuple[bytes, bytes]], bytes]]
+
+_I3_HEADER = struct.Struct("=6sII")
+
+
+def niri_framing(data: bytes, refuse: bool) -> tuple[list[tuple[bytes, bytes]], bytes]:
+    *lines, rest = data.split(b"\n")
+    reply = b'{"Err":"refused"}\n' if refuse else b'{"Ok":"Handled"}\n'
+    return [(line, reply) for line in lines], rest
+
+
+def sway_framing(data: bytes, refuse: bool) -> tuple[list[tuple[bytes, bytes]], bytes]:
+    requests = []
+    payload = b'[{"success":%s}]' % (b"false" if refuse else b"true")
+    reply = _I3_HEADER.pack(b"i3-ipc", len(payload), 0) + payload
+    while len(data) >= _I3_HEADER.size:
+        _, length, _ = _I3_HEADER.unpack_from(data)
+        end = _I3_HEADER.size + length
+        if len(data) < end:
+            break
+        requests.append((data[_I3_HEADER.size : end], reply))
+        data = data[end:]
+    return requests, data
+
+
+def hyprland_framing(
+    data: bytes, refuse: bool
+) -> tuple[list[tuple[bytes, bytes]], bytes]:
+    # one request per connection, sent in one write
+    return ([(data, b"refused" if refuse else b"ok")], b"") if data else ([], b"")
+
+
+class FakeCompositor(QObject):
+    """A local socket that answers requests like a compositor, after `reply_ms`."""
+
+    def __init__(
+        self, path: str, framing: Framing, closes: bool, reply_ms: int, refuse: bool
+    ) -> None:
+        super().__init__()
+        self.framing = framing
+        self.closes = closes  # after each reply, like Hyprland
+        self.reply_ms = reply_ms
+        self.refuse = refuse
+        self.requests: list[bytes] = []
+        self.connections = 0
+
+        QLocalServer.removeServer(path)
+        self._server = QLocalServer(self)
+        self._server.newConnection.connect(self._on_connection)
+        if not self._server.listen(path):
+            raise OSError(f"Could not listen on {path}: {self._server.errorString()}")
+
+    def _on_connection(self) -> None:
+        conn = self._server.nextPendingConnection()
+        self.connections += 1
+        buffer = [b""]
+
+        def on_ready_read() -> None:
+            requests, buffer[0] = self.framing(
+                buffer[0] + bytes(conn.readAll().data()), self.refuse
+            )
+            for request, reply in requests:
+                self.requests.append(request)
+                QTimer.singleShot(self.reply_ms, lambda r=reply: self._reply(conn, r))
+
+        conn.readyRead.connect(on_ready_read)
+        on_ready_read()  # it may have written before it was connected
+
+    def _reply(self, conn: QLocalSocket, reply: bytes) -> None:
+        if conn.state() != QLocalSocket.LocalSocketState.ConnectedState:
+            return
+        conn.write(reply)
+        conn.flush()
+        if self.closes:
+            conn.disconnectFromServer()
+
+
+BACKENDS: dict[str, tuple[type[IpcPositioner], Framing, bool]] = {
+    "niri": (NiriPositioner, niri_framing, False),
+    "sway": (SwayPositioner, sway_framing, False),
+    "hyprland": (HyprlandPositioner, hyprland_framing, True),
+}
+
+
+def requested_position(request: bytes) -> tuple[int, int] | None:
+    """Position a request of any of the backends moves the window to."""
+    text = request.decode(errors="replace")
+    if match := re.search(
+        r'"x": \{"SetFixed": (-?\d+)\}, "y": \{"SetFixed": (-?\d+)', text
+    ):
+        return int(match[1]), int(match[2])
+    if match := re.search(r"(?:position|exact) (-?\d+) (-?\d+)", text):
+        return int(match[1]), int(match[2])
+    return None
+
+
+def check(
+    app: QApplication,
+    window: QWidget,
+    screens: ScreenIndex,
+    name: str,
+    socket_dir: str,
+    args: argparse.Namespace,
+) -> dict:
+    cls, framing, closes = BACKENDS[name]
+    path = os.path.join(socket_dir, f"{name}.sock")
+    server = FakeCompositor(path, framing, closes, args.reply_ms, args.refuse)
+    positioner = cls(window, screens, path)
+
+    # one move per ms, like a fast drag, then time for the last replies
+    moved = [0]
+
+    def move() -> None:
+        moved[0] += 1
+        positioner.move(moved[0], moved[0] // 2, "check")
+        if moved[0] >= args.moves:
+            timer.stop()
+            QTimer.singleShot(args.reply_ms * 10 + 200, lambda: app.exit(0))
+
+    timer = QTimer()
+    timer.timeout.connect(move)
+    timer.start(1)
+    app.exec()
+
+    target = screens.clamp(args.moves, args.moves // 2, window.width(), window.height())
+    last = requested_position(server.requests[-1]) if server.requests else None
+    report = {
+        "moves": args.moves,
+        "requests": len(server.requests),
+        "connections": server.connections,
+        "last_position": last,
+        "reached_target": last == target,
+        "reported_error": positioner._reported_error,
+    }
+    positioner.deleteLater()
+    server.deleteLater()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--moves", type=int, default=200, help="moves per backend")
+    parser.add_argument(
+        "--reply-ms", type=int, default=10, help="how long the fake sockets take"
+    )
+    parser.add_argument(
+        "--refuse", action="store_true", help="answer every request with an error"
+    )
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    window = QWidget()
+    window.resize(64, 64)
+    window.show()
+    screens = ScreenIndex(window)
+
+    with tempfile.TemporaryDirectory() as socket_dir:
+        report = {
+            name: check(app, window, screens, name, socket_dir, args)
+            for name in BACKENDS
+        }
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
 import sys
 
+from .startup_profile import STARTUP
+
 
 def main():
+    STARTUP.mark("interpreter")
     from PySide6.QtWidgets import QApplication
 
+    STARTUP.mark("qt_imports")
     from . import configs_loader
+    from .profiler import PROFILER
     from .window.gremlin_window import GremlinWindow
 
+    STARTUP.mark("app_imports")
     app = QApplication(sys.argv)
+    STARTUP.mark("qapplication")
     try:
         char = sys.argv[1] if len(sys.argv) > 1 else None
         configs_loader.load_resources_and_preferences(char)
@@ -15,8 +22,10 @@ def main():
         print(f"Fatal Error: Could not load configuration. {e}")
         sys.exit(1)
 
+    PROFILER.setup()
     window = GremlinWindow()
     window.show()
+    STARTUP.mark("window")
     sys.exit(app.exec())
 
 
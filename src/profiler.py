@@ -0,0 +1,196 @@
+"""
+Opt-in profiler of the animation hot path.
+
+Enable it with `"TickProfile"` in config.json or the GREMLIN_TICK_PROFILE environment
+variable (which wins): "-" prints a summary to stderr on exit, any other value is the
+path of a JSON report. When it's off, sections cost one attribute check.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict
+
+from .settings import Preferences
+
+ENV_VAR = "GREMLIN_TICK_PROFILE"
+
+# bucket i holds durations in [2^(i-1), 2^i) microseconds, the last one everything above
+N_BUCKETS = 22
+
+# parts of a tick; whatever is left of it is state machine logic ("fsm")
+TICK_PARTS = ("lookup", "decode", "pixmap", "move")
+
+_OFF = nullcontext()
+
+
+class Histogram:
+    """Fixed log2 buckets of durations, so recording never allocates."""
+
+    __slots__ = ("buckets", "count", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * N_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int) -> None:
+        self.buckets[min(N_BUCKETS - 1, (ns // 1000).bit_length())] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile_us(self, p: float) -> int:
+        # upper bound of the bucket holding the p-th percentile
+        target = p * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= target:
+                return 1 << i
+        return 0
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_us": round(self.total_ns / self.count / 1000, 1) if self.count else 0,
+            "p50_us": self.percentile_us(0.5),
+            "p90_us": self.percentile_us(0.9),
+            "p99_us": self.percentile_us(0.99),
+            "max_us": round(self.max_ns / 1000, 1),
+        }
+
+
+class _Section:
+    """Records its time minus that of the sections nested in it on the GUI thread."""
+
+    __slots__ = ("profiler", "name", "start", "nested_ns", "on_gui")
+
+    def __init__(self, profiler: "TickProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.nested_ns = 0
+        self.on_gui = threading.get_ident() == profiler.gui_thread
+
+    def __enter__(self) -> None:
+        if self.on_gui:
+            self.profiler.open_sections.append(self)
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *_) -> None:
+        ns = time.perf_counter_ns() - self.start
+        if self.on_gui:
+            open_sections = self.profiler.open_sections
+            open_sections.pop()
+            if open_sections:
+                open_sections[-1].nested_ns += ns
+        self.profiler.record(self.name, ns - self.nested_ns)
+
+
+class TickProfiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.output = ""
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._stats: Dict[str, Callable[[], dict]] = {}
+        self._tick_start = 0
+        self._tick_parts = 0  # ns spent in TICK_PARTS during the current tick
+
+        # sections nest on the GUI thread only; loaders decode on their own threads
+        self.gui_thread = threading.get_ident()
+        self.open_sections: list[_Section] = []
+
+    def setup(self) -> None:
+        """Turns the profiler on if configured; call after preferences are loaded."""
+        self.output = os.environ.get(ENV_VAR, Preferences.TickProfile)
+        if self.output and not self.enabled:
+            self.enable()
+            atexit.register(self.dump)
+
+    def enable(self) -> None:
+        """Starts recording without reporting on exit, for tools that read `report()`."""
+        self.enabled = True
+        self.gui_thread = threading.get_ident()
+
+    def add_stats(self, name: str, stats: Callable[[], dict]) -> None:
+        """Includes `stats()` in the report, e.g. the counters of a cache."""
+        self._stats[name] = stats
+
+    """
+    @! ---- Recording ------------------------------------------------------------------------------
+    """
+
+    def section(self, name: str):
+        """Context manager timing a part of the hot path."""
+        if not self.enabled:
+            return _OFF
+        return _Section(self, name)
+
+    def begin_tick(self) -> None:
+        if self.enabled:
+            self._tick_parts = 0
+            self._tick_start = time.perf_counter_ns()
+
+    def end_tick(self) -> None:
+        if not self.enabled:
+            return
+        total = time.perf_counter_ns() - self._tick_start
+        self.record("tick", total)
+        self.record("fsm", max(0, total - self._tick_parts))
+
+    def record(self, name: str, ns: int) -> None:
+        # decodes are recorded from loader threads too; a lost count there is fine
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+        hist.record(ns)
+        if name in TICK_PARTS and threading.get_ident() == self.gui_thread:
+            self._tick_parts += ns
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    """
+    @! ---- Report ---------------------------------------------------------------------------------
+    """
+
+    def report(self) -> dict:
+        return {
+            "sections": {k: h.summary() for k, h in self.histograms.items()},
+            "counters": dict(self.counters),
+            **{name: stats() for name, stats in self._stats.items()},
+        }
+
+    def dump(self) -> None:
+        report = self.report()
+        if self.output != "-":
+            try:
+                with open(self.output, "w") as f:
+                    json.dump(report, f, indent=2)
+                return
+            except OSError as e:
+                print(f"Could not write tick profile to {self.output}: {e}")
+
+        print("---- tick profile (us) ----", file=sys.stderr)
+        for name, s in report["sections"].items():
+            print(
+                f"{name:>8}: n={s['count']:<7} mean={s['mean_us']:<8} "
+                f"p50={s['p50_us']:<6} p90={s['p90_us']:<6} p99={s['p99_us']:<6} "
+                f"max={s['max_us']}",
+                file=sys.stderr,
+            )
+        for name, value in report["counters"].items():
+            print(f"{name}: {value}", file=sys.stderr)
+        for name in self._stats:
+            print(f"{name}: {report[name]}", file=sys.stderr)
+
+
+PROFILER = TickProfiler()
@@ -1,5 +1,5 @@
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Tuple
 
 from .states import Direction, State
@@ -16,36 +16,49 @@ class SpriteProperties:
     FrameHeight: int = 0
     FrameWidth: int = 0
     HasReloadAnimation: bool = False
+    FrameRateCaps: dict = {}  # e.g. {"Sleep": 10}, overrides Preferences.FrameRateCaps
 
 
 @dataclass
 class AnimationData:
     """
-    Each animation has three properties:
+    Each animation has these properties:
     1. sprite_path: The path to the sprite file.
     2. frame_count: The total number of frames in the animation.
-    3. current_frame: The current frame being displayed.
+    3. current_frame: The current tick of the animation.
+    4. frame_durations: How many ticks each frame stays on screen (1 each if empty).
 
     (1) and (2) must be given by `sprite-map.json` and `frame-count.json`.
+    (4) may be given by the optional "Durations" map of `frame-count.json`.
     """
 
     sprite_path: str
     frame_count: int
     current_frame: int
+    frame_durations: list[int] = field(default_factory=list)
+
+    @property
+    def length(self) -> int:
+        """Length of one loop of the animation, in ticks."""
+        if self.frame_durations:
+            return sum(self.frame_durations)
+        return self.frame_count
 
 
 @dataclass
 class SoundData:
     """
-    Each sound has two properties:
-    1. sound_file: The name of the sound file.
+    Each sound has three properties:
+    1. sound_path: The file that is played, transcoded from (3) once it's cached.
     2. last_played: The last time the sound was played, which helps prevent sound overlap.
+    3. source_path: The sound file of the character.
 
-    (1) must be given by `sound-map.json`.
+    (3) must be given by `sound-map.json`.
     """
 
     sound_path: str
     last_played: datetime.datetime
+    source_path: str
 
 
 class ResourceRegistry:
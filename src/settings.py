@@ -7,15 +7,24 @@ class Preferences:
     # Well, my name is iluvgirlswithglasses, what do you expect about my length preferences?
     StartingChar: str = "Matikanetannhauser"
     Systray: bool = False
-    MoveSpeed: int = 5
+    MoveSpeed: int = 5  # pixels per 1/60 s
+    MoveAcceleration: int = 0  # px/s², 0 starts and stops at once
     Volume: float = 0.8
     AudioDevice: str = "Default"
+    SoundVoices: int = 4  # sounds that may play at once
+    SoundVoiceStealing: str = "oldest"  # "oldest" stops it, "none" drops the new one
+    SoundNormalize: bool = False  # bring every cached sound to the same loudness
     Scale: float = 1.0
     AnimationSpeed: float = 1.0
     EmoteKeyEnabled: bool = True
     EmoteKey: str = "P"
     IdleMinutes: int = 5  # minutes
     SleepMinutes: int = 5  # minutes
+    SpriteCacheMB: int = 256  # 0 means unlimited
+    SpriteDiskCache: bool = True
+    FrameRateCaps: dict = {}  # e.g. {"Sleep": 10, "Idle": 20}
+    PositionBackend: str = "auto"  # "auto", "qt", "niri", "sway" or "hyprland"
+    TickProfile: str = ""  # "" off, "-" stderr, otherwise a JSON file path
 
 
 class EmotePreferences:
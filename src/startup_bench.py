@@ -0,0 +1,147 @@
+"""
+Cold and warm launch benchmark.
+
+    python -m src.startup_bench [--runs N] [--offscreen] [--out FILE] [CHARACTER]
+
+Launches the gremlin N times after dropping the page cache (cold) and N times with
+everything cached (warm), each time until its first frame is painted, and reports
+the distribution of every startup phase (see src.startup_profile) as JSON.
+
+Dropping the whole page cache needs root. Otherwise the files a launch reads
+(character, sprite cache, PySide6, this app) are evicted one by one, which is
+close but leaves shared system libraries cached.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import PySide6
+
+from . import configs_loader
+from .engines import disk_cache
+from .resources import ResourceRegistry
+from .settings import Preferences
+from .startup_profile import ENV_VAR, EXIT_ENV_VAR
+
+
+def drop_page_cache(paths: list[Path]) -> str:
+    """Evicts cached file pages. Returns the method that was permitted."""
+    os.sync()
+    try:
+        Path("/proc/sys/vm/drop_caches").write_text("1\n")
+        return "drop_caches"
+    except OSError:
+        pass
+
+    for root in paths:
+        files = [root] if root.is_file() else root.rglob("*")
+        for file in files:
+            try:
+                fd = os.open(file, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    return "fadvise"
+
+
+def launch(char: str | None, env: dict) -> dict:
+    """Starts the gremlin until its first frame and returns its startup phases."""
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / "startup.json"
+        cmd = [sys.executable, "-m", "src.launcher"] + ([char] if char else [])
+        subprocess.run(
+            cmd,
+            cwd=configs_loader.BASE_DIR,
+            env={**env, ENV_VAR: str(report), EXIT_ENV_VAR: "1"},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=120,
+            check=False,
+        )
+        if not report.exists():
+            raise RuntimeError(f"'{' '.join(cmd)}' exited before its first frame")
+        return json.loads(report.read_text())
+
+
+def distribution(values: list[float]) -> dict:
+    ordered = sorted(values)
+    return {
+        "min": round(ordered[0], 2),
+        "median": round(statistics.median(ordered), 2),
+        "p90": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))], 2),
+        "max": round(ordered[-1], 2),
+        "mean": round(statistics.fmean(ordered), 2),
+    }
+
+
+def summarize(runs: list[dict]) -> dict:
+    """Distributions of when each phase ended and of how long it took, across runs."""
+    ends = [run["at_ms"] for run in runs]
+    phases = {phase for run in ends for phase in run}
+    by_end = sorted(phases, key=lambda p: statistics.median(r.get(p, 0) for r in ends))
+    return {
+        key: {
+            phase: distribution([run[key][phase] for run in runs if phase in run[key]])
+            for phase in by_end
+        }
+        for key in ("at_ms", "duration_ms")
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("char", nargs="?", help="character (default: StartingChar)")
+    parser.add_argument("--runs", type=int, default=5, help="launches per mode")
+    parser.add_argument(
+        "--offscreen", action="store_true", help="don't open a real window"
+    )
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    # everything a launch reads from disk
+    configs_loader.load_resources_and_preferences(args.char)
+    paths = [Path(configs_loader.CODE_DIR), Path(PySide6.__file__).parent]
+    paths += [Path(d.sprite_path) for d in ResourceRegistry.animations.values()]
+    paths += [Path(d.sound_path) for d in ResourceRegistry.sounds.values()]
+    if disk_cache.CACHE_DIR.exists():
+        paths.append(disk_cache.CACHE_DIR)
+
+    cold, method = [], ""
+    for _ in range(args.runs):
+        method = drop_page_cache(paths)
+        cold.append(launch(args.char, env))
+
+    launch(args.char, env)  # fill the caches
+    warm = [launch(args.char, env) for _ in range(args.runs)]
+
+    report = {
+        "character": Preferences.StartingChar,
+        "runs": args.runs,
+        "cold_method": method,
+        "cold": summarize(cold),
+        "warm": summarize(warm),
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
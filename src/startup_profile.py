@@ -0,0 +1,82 @@
+"""
+Timestamps of the startup phases, from process start to the first painted frame.
+
+Enable it with the GREMLIN_STARTUP_PROFILE environment variable: "-" prints the phases
+to stderr, any other value is the path of a JSON report. GREMLIN_STARTUP_EXIT=1 also
+quits right after the first frame, for benchmarks (see src.startup_bench).
+
+Kept free of Qt imports so that importing it doesn't skew what it measures.
+"""
+
+import json
+import os
+import sys
+import time
+
+ENV_VAR = "GREMLIN_STARTUP_PROFILE"
+EXIT_ENV_VAR = "GREMLIN_STARTUP_EXIT"
+
+
+def _process_age() -> float:
+    # seconds since the process was created, so the interpreter's own startup counts;
+    # /proc only has a 10ms resolution, and non-Linux systems start the clock here
+    try:
+        with open("/proc/self/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        start = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        return max(0.0, time.clock_gettime(time.CLOCK_BOOTTIME) - start)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0.0
+
+
+class StartupProfile:
+    def __init__(self) -> None:
+        self.output = os.environ.get(ENV_VAR, "")
+        self.active = bool(self.output)
+        self.marks: dict[str, float] = {}
+        self._origin = time.perf_counter() - _process_age() if self.active else 0.0
+
+    def mark(self, phase: str) -> None:
+        """Records the end of `phase`; only its first occurrence counts."""
+        if self.active and phase not in self.marks:
+            self.marks[phase] = (time.perf_counter() - self._origin) * 1000
+
+    def finish(self) -> None:
+        """Reports the phases once the first frame is on screen."""
+        if not self.active:
+            return
+        self.mark("first_frame")
+        self.active = False
+        self._dump()
+        if os.environ.get(EXIT_ENV_VAR) == "1":
+            os._exit(0)
+
+    def report(self) -> dict:
+        # phases end in the order they happened, each lasting since the previous one
+        ordered = sorted(self.marks.items(), key=lambda item: item[1])
+        durations, last = {}, 0.0
+        for phase, at in ordered:
+            durations[phase] = round(at - last, 2)
+            last = at
+        return {
+            "at_ms": {phase: round(at, 2) for phase, at in ordered},
+            "duration_ms": durations,
+        }
+
+    def _dump(self) -> None:
+        report = self.report()
+        if self.output != "-":
+            try:
+                with open(self.output, "w") as f:
+                    json.dump(report, f, indent=2)
+                return
+            except OSError as e:
+                print(f"Could not write startup profile to {self.output}: {e}")
+
+        print("---- startup (ms) ----", file=sys.stderr)
+        for phase, at in report["at_ms"].items():
+            took = report["duration_ms"][phase]
+            print(f"{phase:>14}: at {at:>9.2f}  took {took:>9.2f}", file=sys.stderr)
+
+
+STARTUP = StartupProfile()
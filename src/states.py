@@ -96,3 +96,48 @@ LoopAnimations = [
     State.GRAB,
     State.SLEEP,
 ]
+
+
+# ----------------------------------------------------------------------------------------
+# Transition graph (used to guess which animations are about to play)
+# ----------------------------------------------------------------------------------------
+
+# states entered without user input, by animation completion or by timers
+# (mirrors StateManager.on_completion and TimerManager's ticks)
+AutoTransitions = {
+    State.INTRO: [State.IDLE, State.HOVER],
+    State.PAT: [State.IDLE, State.HOVER],
+    State.POKE: [State.IDLE, State.HOVER],
+    State.RELOAD: [State.IDLE, State.HOVER],
+    State.LEFT_ACTION: [State.RELOAD, State.IDLE, State.HOVER],
+    State.RIGHT_ACTION: [State.RELOAD, State.IDLE, State.HOVER],
+    State.WALK_IDLE: [State.IDLE, State.HOVER],
+    State.EMOTE: [State.IDLE, State.HOVER],
+    State.GRAB: [State.IDLE, State.HOVER],
+    State.IDLE: [State.HOVER, State.SLEEP, State.EMOTE],
+    State.HOVER: [State.IDLE, State.EMOTE],
+    State.SLEEP: [State.IDLE, State.EMOTE],
+    State.WALK: [State.WALK_IDLE],
+}
+
+# states the user can trigger from any of AllowedClickStates
+ClickTransitions = [
+    State.GRAB,
+    State.POKE,
+    State.PAT,
+    State.LEFT_ACTION,
+    State.RIGHT_ACTION,
+]
+
+
+def next_states(state: State) -> list[State]:
+    """
+    Lists the states reachable from `state` in a single transition,
+    the most likely ones first.
+    """
+    ans = list(AutoTransitions.get(state, []))
+    if state in AllowedWalkStates:
+        ans.append(State.WALK)
+    if state in AllowedClickStates:
+        ans.extend(ClickTransitions)
+    return [s for i, s in enumerate(ans) if s not in ans[:i]]
@@ -1,23 +1,24 @@
 import sys
-import os
-import subprocess
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QLabel, QWidget
+from PySide6.QtWidgets import QApplication, QWidget
 
-from .. import resources
 from ..engines import FrameEngine, SoundEngine
+from ..engines.sprite_engine import scaled_frame_size
 from ..fsm.animation_ticker import AnimationTicker
 from ..fsm.state_manager import StateManager
 from ..fsm.timer_manager import TimerManager
 from ..fsm.walk_manager import WalkManager
-from ..settings import Preferences
-from ..states import State
+from ..states import Direction, State
 from .hotspot_manager import HotspotManager
 from .hover_manager import HoverManager
 from .input_filter import WindowInputFilter
+from .input_recorder import attach_from_env
 from .keyboard_manager import KeyboardManager
 from .mouse_manager import MouseManager
+from .positioning import create_positioner
+from .screen_index import ScreenIndex
+from .sprite_widget import SpriteWidget
 from .systray_icon import SystrayIcon
 
 
@@ -31,29 +32,32 @@ class GremlinWindow(QWidget):
             Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint
         )
 
-        # True if running under the niri compositor
-        self.is_niri = os.environ.get("NIRI_SOCKET") is not None
+        # moves the window, through the compositor's IPC where move() is ignored,
+        # keeping it within the screens
+        self.screens = ScreenIndex(self)
+        self.positioner = create_positioner(self, self.screens)
 
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
-        scale = Preferences.Scale
-        w = int(resources.SpriteProperties.FrameWidth * scale)
-        h = int(resources.SpriteProperties.FrameHeight * scale)
+        w, h = scaled_frame_size()
         self.setFixedSize(w, h)
         self.setWindowTitle("ilgwg_desktop_gremlins.py")
 
-        # --- Sprite label ---------------------------------------------------------------
-        self.sprite_label = QLabel(self)
-        self.sprite_label.setGeometry(0, 0, w, h)
-        self.sprite_label.setScaledContents(True)
+        # --- Sprite canvas --------------------------------------------------------------
+        # frames are pre-scaled to the window size, so they are painted 1:1
+        self.sprite_widget = SpriteWidget(self)
+        self.sprite_widget.setGeometry(0, 0, w, h)
 
         # --- Core logic components ------------------------------------------------------
-        self.frame_engine = FrameEngine(self.sprite_label)
+        self.frame_engine = FrameEngine(self.sprite_widget)
         self.sound_engine = SoundEngine(self)
         self.walk_manager = WalkManager()
         self.state_manager = StateManager(
-            self.sound_engine, self.underMouse, self._on_exit
+            self.sound_engine,
+            self.underMouse,
+            self._on_exit,
+            self._on_animation_reset,
         )
         self.animation_ticker = AnimationTicker(
             self.state_manager, self.frame_engine, self._update_position
@@ -61,7 +65,9 @@ class GremlinWindow(QWidget):
         self.timer_manager = TimerManager(self.state_manager, self.animation_ticker)
 
         # --- Input managers (no event-slot assignment) ----------------------------------
-        self.mouse_manager = MouseManager(self.state_manager, self.timer_manager, self)
+        self.mouse_manager = MouseManager(
+            self.state_manager, self.timer_manager, self.positioner
+        )
         self.keyboard_manager = KeyboardManager(
             self.state_manager, self.walk_manager, self.timer_manager
         )
@@ -78,37 +84,40 @@ class GremlinWindow(QWidget):
         self.input_filter.register_keyboard(self.keyboard_manager)
         self.input_filter.register_hover(self.hover_manager)
         self.installEventFilter(self.input_filter)
+        attach_from_env(
+            self.input_filter, self.hotspot_manager.filters, self.timer_manager.rng
+        )
 
         # --- Systray + start ------------------------------------------------------------
         self.systray_icon = SystrayIcon(self, self.close_app)
         self._closing = False
 
+        # decode the first sheets in the background; the intro plays once it's ready
         self.state_manager.transition_to(State.INTRO)
-        self.timer_manager.start_passive_timer()
-
-    def _update_position(self) -> None:
-        dx, dy = self.walk_manager.get_velocity()
-        if dx != 0 or dy != 0:
-            self.move(self.pos().x() + dx, self.pos().y() + dy)
-            if self.is_niri:
-                subprocess.run(
-                    [
-                        "niri",
-                        "msg",
-                        "action",
-                        "move-floating-window",
-                        "--x",
-                        str(self.pos().x() + dx),
-                        "--y",
-                        str(self.pos().y() + dy),
-                    ],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    check=False,
-                )
+        self.frame_engine.loader.preload_startup()
+        self.frame_engine.loader.when_ready(
+            (State.INTRO, Direction.NONE), self.timer_manager.start_passive_timer
+        )
+
+        # audio is loaded in the background once the gremlin is on screen
+        self.sprite_widget.first_painted.connect(self.sound_engine.start)
+
+    def _update_position(self) -> bool:
+        pos = self.positioner.pos()
+        target = self.walk_manager.step(pos.x(), pos.y())
+        if target is not None:
+            self.positioner.move(*target)
+        return self.walk_manager.in_motion()
+
+    def _on_animation_reset(self) -> None:
+        self.animation_ticker.reset()
+        self.timer_manager.wake_master_timer()
 
     def _on_exit(self) -> None:
         self.timer_manager.stop_all()
+        self.frame_engine.loader.stop()
+        if self.input_filter.recorder is not None:
+            self.input_filter.recorder.close()
         QApplication.quit()
         sys.exit(0)  # without this, the app freezes on some platforms (like mine)
 
@@ -116,9 +125,14 @@ class GremlinWindow(QWidget):
         if self._closing:
             return
         self._closing = True
-        self.state_manager.transition_to(State.OUTRO)
         self.input_filter.unregister_all()
 
+        # the outro can follow any state, so it's only decoded now, in the background
+        self.frame_engine.loader.when_ready(
+            (State.OUTRO, Direction.NONE),
+            lambda: self.state_manager.transition_to(State.OUTRO),
+        )
+
     def closeEvent(self, event) -> None:
         event.ignore()
         self.close_app()
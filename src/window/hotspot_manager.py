@@ -10,6 +10,7 @@ from .hotspot_geometry import (
     compute_top_hotspot_geometry,
 )
 from .input_listeners import MouseListener
+from .input_recorder import InputRecorder
 
 
 class HotspotFilter(QObject):
@@ -20,6 +21,7 @@ class HotspotFilter(QObject):
 
     def __init__(
         self,
+        name: str,
         action_state: State,
         allowed_from: list[State],
         state_manager: StateManager,
@@ -28,17 +30,28 @@ class HotspotFilter(QObject):
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
+        self.name = name
         self.action_state = action_state
         self.allowed_from = allowed_from
         self.state_manager = state_manager
         self.timer_manager = timer_manager
         self.mouse_listener = mouse_listener
 
+        # see input_recorder.attach_from_env
+        self.recorder: InputRecorder | None = None
+
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: ARG002
         if event.type() != QEvent.Type.MouseButtonPress:
             return False
 
         btn = event.button()  # type: ignore[attr-defined]
+        if self.recorder is not None and btn in (
+            Qt.MouseButton.LeftButton,
+            Qt.MouseButton.RightButton,
+        ):
+            # the window's filter never sees these presses
+            self.recorder.record(event, self.name)
+
         if btn == Qt.MouseButton.RightButton:
             if self.state_manager.current_state in self.allowed_from:
                 self.state_manager.transition_to(self.action_state)
@@ -73,9 +86,15 @@ class HotspotManager:
 
         # each hotspot gets its own filter with the matching action state
         self._top_filter = HotspotFilter(
-            State.PAT, allowed_from, state_manager, timer_manager, mouse_listener
+            "top",
+            State.PAT,
+            allowed_from,
+            state_manager,
+            timer_manager,
+            mouse_listener,
         )
         self._left_filter = HotspotFilter(
+            "left",
             State.LEFT_ACTION,
             allowed_from,
             state_manager,
@@ -83,6 +102,7 @@ class HotspotManager:
             mouse_listener,
         )
         self._right_filter = HotspotFilter(
+            "right",
             State.RIGHT_ACTION,
             allowed_from,
             state_manager,
@@ -93,3 +113,8 @@ class HotspotManager:
         self._t.installEventFilter(self._top_filter)
         self._l.installEventFilter(self._left_filter)
         self._r.installEventFilter(self._right_filter)
+
+        # by name, for recording and replaying input
+        self.filters = {
+            f.name: f for f in (self._top_filter, self._left_filter, self._right_filter)
+        }
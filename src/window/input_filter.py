@@ -1,6 +1,7 @@
 from PySide6.QtCore import QEvent, QObject
 
 from .input_listeners import HoverListener, KeyboardListener, MouseListener
+from .input_recorder import InputRecorder, InputReplayer
 
 
 class WindowInputFilter(QObject):
@@ -16,6 +17,10 @@ class WindowInputFilter(QObject):
         self._keyboard: list[KeyboardListener] = []
         self._hover: list[HoverListener] = []
 
+        # see input_recorder.attach_from_env
+        self.recorder: InputRecorder | None = None
+        self.replayer: InputReplayer | None = None
+
     def register_mouse(self, listener: MouseListener) -> None:
         self._mouse.append(listener)
 
@@ -32,6 +37,8 @@ class WindowInputFilter(QObject):
         self._hover.clear()
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if self.recorder is not None:
+            self.recorder.record(event)
         match event.type():
             case QEvent.Type.MouseButtonPress:
                 for listener in self._mouse:
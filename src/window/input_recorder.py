@@ -0,0 +1,232 @@
+"""
+Recording and replay of the input seen by WindowInputFilter, to reproduce
+performance issues of real sessions.
+
+- GREMLIN_RECORD_INPUT=<file>   records every mouse, keyboard and hover event.
+- GREMLIN_REPLAY_INPUT=<file>   feeds a recording back to the listeners,
+  GREMLIN_REPLAY_SPEED=<x>      at `x` times the original pace (default 1).
+- GREMLIN_SEED=<n>              fixes the randomness of the emote timer.
+  Recordings store the seed they ran with, and replays reuse it.
+
+A recording is JSON lines: a header, then one compact array per event starting
+with its time in ms since the recording started. Presses on a hotspot go through
+that hotspot's filter instead of the window's, so they are tagged with its name.
+"""
+
+import json
+import os
+import random
+import time
+from typing import IO, Callable
+
+from PySide6.QtCore import QEvent, QObject, QPointF, Qt, QTimer
+from PySide6.QtGui import QEnterEvent, QKeyEvent, QMouseEvent
+
+RECORD_ENV = "GREMLIN_RECORD_INPUT"
+REPLAY_ENV = "GREMLIN_REPLAY_INPUT"
+SPEED_ENV = "GREMLIN_REPLAY_SPEED"
+SEED_ENV = "GREMLIN_SEED"
+
+FORMAT_VERSION = 1
+
+# event type <-> tag in the log
+_MOUSE_TAGS = {
+    QEvent.Type.MouseButtonPress: "mp",
+    QEvent.Type.MouseMove: "mm",
+    QEvent.Type.MouseButtonRelease: "mr",
+}
+_KEY_TAGS = {
+    QEvent.Type.KeyPress: "kp",
+    QEvent.Type.KeyRelease: "kr",
+}
+_TAG_TYPES = {tag: t for t, tag in {**_MOUSE_TAGS, **_KEY_TAGS}.items()}
+
+
+class InputRecorder:
+    def __init__(self, path: str, seed: int) -> None:
+        # line buffered, so a crash still leaves a usable log
+        self._file: IO[str] = open(path, "w", buffering=1)
+        self._start = time.monotonic()
+        self._write({"version": FORMAT_VERSION, "seed": seed})
+
+    def record(self, event: QEvent, hotspot: str = "") -> None:
+        """Records `event`, seen by the filter of `hotspot` or else by the window's."""
+        t = round((time.monotonic() - self._start) * 1000, 1)
+        kind = event.type()
+        if kind in _MOUSE_TAGS:
+            pos = event.position()  # type: ignore[attr-defined]
+            gpos = event.globalPosition()  # type: ignore[attr-defined]
+            self._write(
+                [
+                    t,
+                    _MOUSE_TAGS[kind],
+                    event.button().value,  # type: ignore[attr-defined]
+                    event.buttons().value,  # type: ignore[attr-defined]
+                    pos.x(),
+                    pos.y(),
+                    gpos.x(),
+                    gpos.y(),
+                    hotspot,
+                ]
+            )
+        elif kind in _KEY_TAGS:
+            self._write(
+                [
+                    t,
+                    _KEY_TAGS[kind],
+                    event.key(),  # type: ignore[attr-defined]
+                    int(event.isAutoRepeat()),  # type: ignore[attr-defined]
+                ]
+            )
+        elif kind == QEvent.Type.Enter:
+            pos = event.position()  # type: ignore[attr-defined]
+            gpos = event.globalPosition()  # type: ignore[attr-defined]
+            self._write([t, "en", pos.x(), pos.y(), gpos.x(), gpos.y()])
+        elif kind == QEvent.Type.Leave:
+            self._write([t, "lv"])
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _write(self, data) -> None:
+        if self._file.closed:
+            return  # events that arrive while the app quits
+        self._file.write(json.dumps(data, separators=(",", ":")) + "\n")
+
+
+class InputReplayer:
+    """
+    Feeds a recording to `target` at `speed` times its pace, along with the hotspot
+    each event was recorded on ("" for the window itself).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        target: Callable[[QEvent, str], None],
+        speed: float = 1.0,
+        on_finished: Callable[[], None] | None = None,
+    ) -> None:
+        with open(path) as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        if not lines or lines[0].get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not an input recording")
+
+        self.seed: int = lines[0]["seed"]
+        self._events: list[list] = lines[1:]
+        self._target = target
+        self._speed = max(speed, 1e-3)
+        self._on_finished = on_finished
+        self._next = 0
+        self._start = 0.0
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._dispatch)
+
+    def start(self) -> None:
+        self._start = time.monotonic()
+        self._next = 0
+        self._arm()
+
+    def _dispatch(self) -> None:
+        # deliver everything that is due, so a stalled loop catches up in order
+        elapsed_ms = (time.monotonic() - self._start) * 1000 * self._speed
+        while (
+            self._next < len(self._events) and self._events[self._next][0] <= elapsed_ms
+        ):
+            self._target(*_to_event(self._events[self._next]))
+            self._next += 1
+        self._arm()
+
+    def _arm(self) -> None:
+        if self._next >= len(self._events):
+            if self._on_finished is not None:
+                self._on_finished()
+            return
+        due_ms = self._events[self._next][0] / self._speed
+        elapsed_ms = (time.monotonic() - self._start) * 1000
+        self._timer.start(max(0, int(due_ms - elapsed_ms)))
+
+
+def _to_event(entry: list) -> tuple[QEvent, str]:
+    tag = entry[1]
+    if tag in ("mp", "mm", "mr"):
+        _, _, button, buttons, x, y, gx, gy, hotspot = entry
+        event = QMouseEvent(
+            _TAG_TYPES[tag],
+            QPointF(x, y),
+            QPointF(gx, gy),
+            Qt.MouseButton(button),
+            Qt.MouseButton(buttons),
+            Qt.KeyboardModifier.NoModifier,
+        )
+        return event, hotspot
+    if tag in ("kp", "kr"):
+        _, _, key, autorepeat = entry
+        event = QKeyEvent(
+            _TAG_TYPES[tag], key, Qt.KeyboardModifier.NoModifier, "", bool(autorepeat)
+        )
+        return event, ""
+    if tag == "en":
+        _, _, x, y, gx, gy = entry
+        return QEnterEvent(QPointF(x, y), QPointF(x, y), QPointF(gx, gy)), ""
+    return QEvent(QEvent.Type.Leave), ""
+
+
+def attach_from_env(
+    input_filter: QObject, hotspot_filters: dict[str, QObject], rng: random.Random
+) -> None:
+    """
+    Sets up recording and/or replay on `input_filter` and on the filters of the
+    hotspots as requested by the environment, and seeds `rng` so that the session
+    can be reproduced.
+    """
+    seed = _env_number(SEED_ENV, int)
+
+    replay_path = os.environ.get(REPLAY_ENV)
+    replayer = None
+    if replay_path:
+        window = input_filter.parent()
+
+        def dispatch(event: QEvent, hotspot: str) -> None:
+            if hotspot in hotspot_filters:
+                hotspot_filters[hotspot].eventFilter(window, event)
+            else:
+                input_filter.eventFilter(window, event)
+
+        replayer = InputReplayer(
+            replay_path,
+            dispatch,
+            _env_number(SPEED_ENV, float) or 1.0,
+            lambda: print(f"Finished replaying {replay_path}"),
+        )
+        seed = replayer.seed if seed is None else seed
+
+    record_path = os.environ.get(RECORD_ENV)
+    if record_path and seed is None:
+        seed = random.randrange(2**32)
+
+    if seed is not None:
+        rng.seed(seed)
+    if record_path:
+        recorder = InputRecorder(record_path, seed)
+        input_filter.recorder = recorder
+        for hotspot_filter in hotspot_filters.values():
+            hotspot_filter.recorder = recorder
+    if replayer is not None:
+        input_filter.replayer = replayer
+        replayer.start()
+
+
+def _env_number(name: str, parse: Callable[[str], int | float]):
+    """`parse`d value of the environment variable `name`, or None if unset or invalid."""
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        return parse(value)
+    except ValueError:
+        print(f"Ignoring {name}={value!r}: not a number")
+        return None
@@ -1,10 +1,11 @@
 from PySide6.QtCore import QPoint, Qt
 from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import QWidget
 
 from ..fsm.state_manager import StateManager
 from ..fsm.timer_manager import TimerManager
+from ..profiler import PROFILER
 from ..states import AllowedClickStates, State
+from .positioning import Positioner
 
 
 class MouseManager:
@@ -12,13 +13,13 @@ class MouseManager:
         self,
         state_manager: StateManager,
         timer_manager: TimerManager,
-        window: QWidget,
+        positioner: Positioner,
     ) -> None:
         self.state_manager = state_manager
         self.timer_manager = timer_manager
 
-        self._move_window = window.move
-        self._window_pos = window.pos
+        self._move_window = positioner.move
+        self._window_pos = positioner.pos
         self._drag_pos = QPoint(0, 0)
 
     def on_mouse_press(self, event: QMouseEvent) -> None:
@@ -42,7 +43,11 @@ class MouseManager:
             self.state_manager.current_state == State.GRAB
             and event.buttons() == Qt.MouseButton.LeftButton
         ):
-            self._move_window(event.globalPosition().toPoint() - self._drag_pos)
+            # mice may report motion 1000 times a second: only the latest target is
+            # kept, and the positioner moves the window there once per frame
+            PROFILER.count("drag_events")
+            target = event.globalPosition().toPoint() - self._drag_pos
+            self._move_window(target.x(), target.y(), "drag")
 
     def on_mouse_release(self, event: QMouseEvent) -> None:
         # release from grab
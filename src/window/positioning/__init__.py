@@ -0,0 +1,45 @@
+"""
+Backends that move the gremlin's window (see Positioner), picked from
+`Preferences.PositionBackend`, or from the environment when it's "auto".
+"""
+
+import os
+
+from PySide6.QtWidgets import QWidget
+
+from ...settings import Preferences
+from ..screen_index import ScreenIndex
+from .base import Positioner
+from .hyprland import HyprlandPositioner, socket_path
+from .niri import NiriPositioner
+from .sway import SwayPositioner
+
+
+def detect_backend() -> str:
+    if os.environ.get("NIRI_SOCKET"):
+        return "niri"
+    if os.environ.get("SWAYSOCK"):
+        return "sway"
+    if os.environ.get("HYPRLAND_INSTANCE_SIGNATURE"):
+        return "hyprland"
+    return "qt"  # X11, including i3, and compositors that honor move()
+
+
+def create_positioner(window: QWidget, screens: ScreenIndex) -> Positioner:
+    backend = Preferences.PositionBackend
+    if backend == "auto":
+        backend = detect_backend()
+
+    match backend:
+        case "niri":
+            return NiriPositioner(window, screens, os.environ.get("NIRI_SOCKET", ""))
+        case "sway":
+            return SwayPositioner(window, screens, os.environ.get("SWAYSOCK", ""))
+        case "hyprland":
+            signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE", "")
+            return HyprlandPositioner(window, screens, socket_path(signature))
+        case _:
+            return Positioner(window, screens)
+
+
+__all__ = ["Positioner", "create_positioner", "detect_backend"]
@@ -0,0 +1,81 @@
+import time
+
+from PySide6.QtCore import QObject, QPoint, Qt, QTimer
+from PySide6.QtWidgets import QWidget
+
+from ...profiler import PROFILER
+from ..screen_index import ScreenIndex
+
+# used when the screen doesn't report its refresh rate
+DEFAULT_REFRESH_RATE = 60.0
+
+
+class Positioner(QObject):
+    """
+    Moves the gremlin's window, at most once per display frame.
+
+    Walking and dragging only set the target position; the window gets there with a
+    single move when the frame is due, however many moves were requested meanwhile.
+    Every target is clamped so that the window stays on the desktop.
+    This base class moves the window with `QWidget.move`, which works on X11.
+    Compositors that ignore it on Wayland get a subclass talking to their IPC.
+    """
+
+    name = "qt"
+
+    def __init__(self, window: QWidget, screens: ScreenIndex) -> None:
+        super().__init__(window)
+        self.window = window
+        self.screens = screens
+        self._target: QPoint | None = None  # requested, not applied yet
+        self._source = ""  # what requested the pending move, for the profiler
+        self._requested_ns = 0  # when the pending move was first requested
+        self._last_apply = 0.0
+
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._frame_timer.timeout.connect(self._apply_target)
+
+    def pos(self) -> QPoint:
+        """Where the window is, or will be once the pending move is applied."""
+        return QPoint(self._target) if self._target is not None else self.window.pos()
+
+    def move(self, x: int, y: int, source: str = "walk") -> None:
+        """Moves the window to (x, y) by the next frame; `source` labels the stats."""
+        if self._target is None:
+            self._source = source
+            self._requested_ns = time.perf_counter_ns()
+        self._target = QPoint(
+            *self.screens.clamp(x, y, self.window.width(), self.window.height())
+        )
+        if self._frame_timer.isActive():
+            return
+        # right away, unless the window already moved during this frame
+        wait = self._last_apply + self.frame_interval() - time.monotonic()
+        self._frame_timer.start(max(0, round(wait * 1000)))
+
+    def frame_interval(self) -> float:
+        """Refresh interval of the screen the window is (about to be) on, in seconds."""
+        pos = self.pos()
+        rate = self.screens.refresh_rate(
+            pos.x() + self.window.width() // 2, pos.y() + self.window.height() // 2
+        )
+        return 1 / (rate if rate > 0 else DEFAULT_REFRESH_RATE)
+
+    def _apply_target(self) -> None:
+        if self._target is None:
+            return
+        x, y = self._target.x(), self._target.y()
+        self._target = None
+        self._last_apply = time.monotonic()
+        self._apply(x, y)
+
+        # e.g. drag_moves, and how long the first of the moves it replaces waited
+        PROFILER.count(f"{self._source}_moves")
+        if PROFILER.enabled:
+            latency_ns = time.perf_counter_ns() - self._requested_ns
+            PROFILER.record(f"{self._source}_latency", latency_ns)
+
+    def _apply(self, x: int, y: int) -> None:
+        self.window.move(x, y)
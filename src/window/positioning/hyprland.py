@@ -0,0 +1,31 @@
+import os
+
+from .ipc import IpcPositioner
+
+
+class HyprlandPositioner(IpcPositioner):
+    """
+    Hyprland: `movewindowpixel exact` dispatches on its request socket, addressed to
+    this process' window. Hyprland answers one request per connection, then closes it.
+    """
+
+    name = "hyprland"
+    persistent = False
+
+    def _encode(self, x: int, y: int) -> bytes:
+        return f"dispatch movewindowpixel exact {x} {y},pid:{os.getpid()}".encode()
+
+    def _take_replies(self, data: bytearray) -> list[bytes]:
+        return []  # the reply ends when the connection does
+
+    def _is_error(self, reply: bytes) -> bool:
+        return reply.strip() != b"ok"
+
+
+def socket_path(signature: str) -> str:
+    # Hyprland moved its sockets from /tmp to $XDG_RUNTIME_DIR in v0.40
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "")
+    path = os.path.join(runtime_dir, "hypr", signature, ".socket.sock")
+    if runtime_dir and os.path.exists(path):
+        return path
+    return os.path.join("/tmp", "hypr", signature, ".socket.sock")
@@ -0,0 +1,123 @@
+import time
+
+from PySide6.QtCore import QTimer
+from PySide6.QtNetwork import QLocalSocket
+from PySide6.QtWidgets import QWidget
+
+from ..screen_index import ScreenIndex
+from .base import Positioner
+
+# after a connection error, wait this long before connecting again (ms)
+RECONNECT_DELAY_MS = 1000
+# a request without a reply after this long is given up on, with its connection (s)
+REPLY_TIMEOUT = 1.0
+
+
+class IpcPositioner(Positioner):
+    """
+    Moves the window through a compositor's IPC socket, which stays connected.
+
+    Only one request is in flight at a time: moves made while waiting for the reply
+    replace each other, so only the latest position goes out. Subclasses encode the
+    requests and split the replies of their compositor's protocol.
+    """
+
+    # False if the compositor closes the connection after each reply
+    persistent = True
+
+    def __init__(self, window: QWidget, screens: ScreenIndex, socket_path: str) -> None:
+        super().__init__(window, screens)
+        self.socket_path = socket_path
+        self._pending: tuple[int, int] | None = None  # latest position not sent yet
+        self._sent_at: float | None = None  # when the request in flight was sent
+        self._reply = bytearray()
+        self._reported_error = False
+
+        self._socket = QLocalSocket(self)
+        self._socket.connected.connect(self._flush)
+        self._socket.readyRead.connect(self._on_ready_read)
+        self._socket.disconnected.connect(self._on_disconnected)
+        self._socket.errorOccurred.connect(self._on_error)
+
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._flush)
+
+    def _apply(self, x: int, y: int) -> None:
+        super()._apply(x, y)  # keeps Qt's idea of the window position in sync
+        self._pending = (x, y)
+        if (
+            self._sent_at is not None
+            and time.monotonic() - self._sent_at > REPLY_TIMEOUT
+        ):
+            self._socket.abort()  # the compositor is stuck on this connection
+        self._flush()
+
+    """
+    @! ---- Protocol -------------------------------------------------------------------------------
+    """
+
+    def _encode(self, x: int, y: int) -> bytes:
+        raise NotImplementedError
+
+    def _take_replies(self, data: bytearray) -> list[bytes]:
+        """Removes the complete replies from the start of `data` and returns them."""
+        raise NotImplementedError
+
+    def _is_error(self, reply: bytes) -> bool:
+        raise NotImplementedError
+
+    """
+    @! ---- Connection -----------------------------------------------------------------------------
+    """
+
+    def _flush(self) -> None:
+        if self._pending is None or self._sent_at is not None:
+            return
+        match self._socket.state():
+            case QLocalSocket.LocalSocketState.ConnectedState:
+                x, y = self._pending
+                self._pending = None
+                self._sent_at = time.monotonic()
+                self._socket.write(self._encode(x, y))
+            case QLocalSocket.LocalSocketState.UnconnectedState:
+                if not self._retry_timer.isActive():
+                    self._socket.connectToServer(self.socket_path)
+            case _:
+                pass  # still connecting; `connected` flushes
+
+    def _on_ready_read(self) -> None:
+        self._reply += bytes(self._socket.readAll().data())
+        for reply in self._take_replies(self._reply):
+            self._on_reply(reply)
+        self._flush()
+
+    def _on_reply(self, reply: bytes) -> None:
+        self._sent_at = None
+        if self._is_error(reply) and not self._reported_error:
+            self._reported_error = True
+            print(f"The {self.name} IPC refused to move the window: {reply!r}")
+
+    def _on_disconnected(self) -> None:
+        if not self.persistent and self._sent_at is not None:
+            self._on_reply(bytes(self._reply))
+        self._reply.clear()
+        self._sent_at = None
+
+        # reconnecting right away from inside this signal would reuse the socket
+        # before Qt is done with it
+        if not self._retry_timer.isActive():
+            self._retry_timer.start(0)
+
+    def _on_error(self, error: QLocalSocket.LocalSocketError) -> None:
+        if error == QLocalSocket.LocalSocketError.PeerClosedError:
+            return
+        if not self._reported_error:
+            self._reported_error = True
+            print(
+                f"Could not talk to {self.name} at {self.socket_path}: "
+                f"{self._socket.errorString()}"
+            )
+        self._sent_at = None
+        self._retry_timer.start(RECONNECT_DELAY_MS)
+        self._socket.abort()
@@ -0,0 +1,31 @@
+import json
+
+from .ipc import IpcPositioner
+
+
+class NiriPositioner(IpcPositioner):
+    """
+    niri ($NIRI_SOCKET): `MoveFloatingWindow` actions, one JSON line each way.
+    The action targets the focused window, as `niri msg` does without `--id`.
+    """
+
+    name = "niri"
+
+    def _encode(self, x: int, y: int) -> bytes:
+        action = {
+            "MoveFloatingWindow": {
+                "id": None,
+                "x": {"SetFixed": x},
+                "y": {"SetFixed": y},
+            }
+        }
+        return json.dumps({"Action": action}).encode() + b"\n"
+
+    def _take_replies(self, data: bytearray) -> list[bytes]:
+        end = data.rfind(b"\n") + 1
+        replies = bytes(data[:end]).splitlines()
+        del data[:end]
+        return replies
+
+    def _is_error(self, reply: bytes) -> bool:
+        return b'"Err"' in reply
@@ -0,0 +1,40 @@
+import json
+import os
+import struct
+
+from .ipc import IpcPositioner
+
+# i3-ipc framing: magic, payload length, message type, in native byte order
+_MAGIC = b"i3-ipc"
+_HEADER = struct.Struct("=6sII")
+_RUN_COMMAND = 0
+
+
+class SwayPositioner(IpcPositioner):
+    """
+    Sway ($SWAYSOCK): `move absolute position` commands over the i3 IPC protocol,
+    addressed to this process' window. i3 itself runs on X11, where Qt moves windows.
+    """
+
+    name = "sway"
+
+    def _encode(self, x: int, y: int) -> bytes:
+        command = f"[pid={os.getpid()}] move absolute position {x} {y}".encode()
+        return _HEADER.pack(_MAGIC, len(command), _RUN_COMMAND) + command
+
+    def _take_replies(self, data: bytearray) -> list[bytes]:
+        replies = []
+        while len(data) >= _HEADER.size:
+            _, length, _ = _HEADER.unpack_from(data)
+            end = _HEADER.size + length
+            if len(data) < end:
+                break
+            replies.append(bytes(data[_HEADER.size : end]))
+            del data[:end]
+        return replies
+
+    def _is_error(self, reply: bytes) -> bool:
+        try:
+            return not all(result.get("success") for result in json.loads(reply))
+        except (ValueError, AttributeError, TypeError):
+            return True
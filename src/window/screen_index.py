@@ -0,0 +1,100 @@
+from PySide6.QtCore import QObject
+from PySide6.QtGui import QGuiApplication, QScreen
+
+
+class ScreenIndex(QObject):
+    """
+    Available geometry, device pixel ratio and refresh rate of every screen, read once
+    and refreshed only when screens are added, removed or changed, so moves never query
+    QScreen.
+
+    Positions are clamped so the window stays on the desktop: it may straddle screens,
+    as long as each of its corners is on one of them.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.rebuilds = 0
+        self._areas: list[tuple[int, int, int, int]] = []  # (left, top, right, bottom)
+        self._dprs: list[float] = []
+        self._rates: list[float] = []  # 0 if the screen doesn't report it
+        self._last = 0  # area the window was last in, which is checked first
+
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._watch)
+        app.screenRemoved.connect(lambda screen: self.rebuild(removed=screen))
+        for screen in app.screens():
+            self._watch(screen, rebuild=False)
+        self.rebuild()
+
+    def rebuild(self, removed: QScreen | None = None) -> None:
+        self._areas, self._dprs, self._rates = [], [], []
+        for screen in QGuiApplication.screens():
+            if screen is removed:
+                continue  # it may still be listed while it's being removed
+            r = screen.availableGeometry()
+            self._areas.append((r.left(), r.top(), r.right() + 1, r.bottom() + 1))
+            self._dprs.append(screen.devicePixelRatio())
+            self._rates.append(screen.refreshRate())
+        self._last = 0
+        self.rebuilds += 1
+
+    def clamp(self, x: int, y: int, w: int, h: int) -> tuple[int, int]:
+        """Closest position to (x, y) where a `w`x`h` window stays on the desktop."""
+        if not self._areas:
+            return x, y
+        if self._holds(self._last, x, y, w, h):
+            return x, y
+        corners = ((x, y), (x + w - 1, y), (x, y + h - 1), (x + w - 1, y + h - 1))
+        areas = [self._area_at(cx, cy) for cx, cy in corners]
+        if None not in areas:
+            self._last = areas[0]
+            return x, y
+
+        # off the desktop: pull it onto the screen its center is on, or the nearest one
+        i = self._nearest_area(x + w // 2, y + h // 2)
+        self._last = i
+        left, top, right, bottom = self._areas[i]
+        return (
+            max(left, min(x, right - w)),
+            max(top, min(y, bottom - h)),
+        )
+
+    def device_pixel_ratio(self, x: int, y: int) -> float:
+        """Device pixel ratio of the screen at (x, y), or of the nearest one."""
+        if not self._dprs:
+            return 1.0
+        return self._dprs[self._nearest_area(x, y)]
+
+    def refresh_rate(self, x: int, y: int) -> float:
+        """Refresh rate of the screen at (x, y), or of the nearest one; 0 if unknown."""
+        if not self._rates:
+            return 0.0
+        return self._rates[self._nearest_area(x, y)]
+
+    def _watch(self, screen: QScreen, rebuild: bool = True) -> None:
+        screen.availableGeometryChanged.connect(lambda _: self.rebuild())
+        screen.geometryChanged.connect(lambda _: self.rebuild())
+        screen.logicalDotsPerInchChanged.connect(lambda _: self.rebuild())
+        screen.refreshRateChanged.connect(lambda _: self.rebuild())
+        if rebuild:
+            self.rebuild()
+
+    def _holds(self, i: int, x: int, y: int, w: int, h: int) -> bool:
+        left, top, right, bottom = self._areas[i]
+        return left <= x and top <= y and x + w <= right and y + h <= bottom
+
+    def _area_at(self, x: int, y: int) -> int | None:
+        for i, (left, top, right, bottom) in enumerate(self._areas):
+            if left <= x < right and top <= y < bottom:
+                return i
+        return None
+
+    def _nearest_area(self, x: int, y: int) -> int:
+        def distance(area: tuple[int, int, int, int]) -> int:
+            left, top, right, bottom = area
+            dx = max(left - x, 0, x - right + 1)
+            dy = max(top - y, 0, y - bottom + 1)
+            return dx * dx + dy * dy
+
+        return min(range(len(self._areas)), key=lambda i: distance(self._areas[i]))
@@ -0,0 +1,48 @@
+from PySide6.QtCore import QRect, Qt, Signal
+from PySide6.QtGui import QPainter, QPaintEvent
+from PySide6.QtWidgets import QWidget
+
+from ..engines.frame_cache import Frame
+from ..startup_profile import STARTUP
+
+
+class SpriteWidget(QWidget):
+    """
+    Paints the current frame straight from its cached pixmap.
+
+    Unlike QLabel.setPixmap, nothing is copied, there's no layout pass, and only
+    the area covered by the previous and the new frame is repainted.
+    """
+
+    # emitted once, after the first frame was painted
+    first_painted = Signal()
+
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        # mouse events belong to the window (and its hotspots), not to the sprite
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._frame: Frame | None = None
+        self._rect = QRect()
+        self._painted = False
+
+    def show_frame(self, frame: Frame) -> None:
+        # same pixels at the same place (e.g. a held pose): nothing to repaint
+        if frame == self._frame:
+            return
+
+        rect = QRect(frame.x, frame.y, frame.pixmap.width(), frame.pixmap.height())
+        self.update(self._rect.united(rect))
+        self._frame = frame
+        self._rect = rect
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        if self._frame is None:
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(self._frame.x, self._frame.y, self._frame.pixmap)
+        painter.end()
+
+        if not self._painted:
+            self._painted = True
+            self.first_painted.emit()
+            STARTUP.finish()